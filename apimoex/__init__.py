@@ -7,7 +7,10 @@
 перечень доступных функций-запросов может быть легко расширен.
 """
 
-from apimoex.client import ISSClient
+from apimoex.batch import get_many_board_history, get_many_market_candles, get_many_tradestats
+from apimoex.cache import configure_cache
+from apimoex.client import AsyncISSClient, ISSClient
+from apimoex.ratelimit import configure_rate_limit
 from apimoex.requests import (
     find_securities,
     find_security_description,
@@ -26,6 +29,7 @@ from apimoex.requests import (
     get_tradestats,
     get_orderstats
 )
+from apimoex.session import make_session
 
 __all__ = [
     "get_reference",
@@ -41,8 +45,15 @@ __all__ = [
     "get_board_history",
     "get_index_tickers",
     "ISSClient",
+    "AsyncISSClient",
     "get_board_today_trades",
     "authenticate",
     "get_tradestats",
-    "get_orderstats"
+    "get_orderstats",
+    "make_session",
+    "configure_cache",
+    "configure_rate_limit",
+    "get_many_board_history",
+    "get_many_market_candles",
+    "get_many_tradestats",
 ]
@@ -0,0 +1,447 @@
+"""Асинхронная реализация запросов к MOEX ISS.
+
+Функции повторяют одноименные функции из apimoex.requests, но принимают aiohttp.ClientSession и являются корутинами.
+Это позволяет загружать данные сразу по нескольким инструментам с помощью asyncio.gather:
+
+    async with aiohttp.ClientSession() as session:
+        data = await asyncio.gather(*(aio.get_board_history(session, ticker) for ticker in tickers))
+"""
+
+import asyncio
+from http import HTTPStatus
+
+import aiohttp
+
+from apimoex import cache as disk_cache
+from apimoex import client, ratelimit
+
+# noinspection PyProtectedMember
+from apimoex.requests import (
+    _BOARD_SECURITIES_COLS,  # pyright: ignore[reportPrivateUsage]
+    _CANDLE_COLS,  # pyright: ignore[reportPrivateUsage]
+    _DESCRIPTION_COLS,  # pyright: ignore[reportPrivateUsage]
+    _HISTORY_COLS,  # pyright: ignore[reportPrivateUsage]
+    _INDEX_TICKERS_COLS,  # pyright: ignore[reportPrivateUsage]
+    _ISS_URL,  # pyright: ignore[reportPrivateUsage]
+    _ORDERSTATS_COLS,  # pyright: ignore[reportPrivateUsage]
+    _PASSPORT_URL,  # pyright: ignore[reportPrivateUsage]
+    _SECURITIES_COLS,  # pyright: ignore[reportPrivateUsage]
+    _TRADES_COLS,  # pyright: ignore[reportPrivateUsage]
+    _TRADESTATS_COLS,  # pyright: ignore[reportPrivateUsage]
+    _basic_auth_header,  # pyright: ignore[reportPrivateUsage]
+    _get_table,  # pyright: ignore[reportPrivateUsage]
+    _make_query,  # pyright: ignore[reportPrivateUsage]
+)
+
+Session = aiohttp.ClientSession | client.AsyncTransport
+
+__all__ = [
+    "get_reference",
+    "find_securities",
+    "find_security_description",
+    "get_market_candle_borders",
+    "get_board_candle_borders",
+    "get_market_candles",
+    "get_board_candles",
+    "get_board_dates",
+    "get_board_securities",
+    "get_market_history",
+    "get_board_history",
+    "get_index_tickers",
+    "get_board_today_trades",
+    "authenticate",
+    "get_tradestats",
+    "get_orderstats",
+]
+
+
+async def _get_short_data(
+    session: Session,
+    url: str,
+    table: str,
+    query: client.WebQuery | None = None,
+    *,
+    use_cache: bool = True,
+) -> client.Table:
+    """Получить данные для запроса с выдачей всей информации за раз.
+
+    :param session:
+        Сессия интернет соединения.
+    :param url:
+        URL запроса.
+    :param table:
+        Таблица, которую нужно выбрать.
+    :param query:
+        Дополнительные параметры запроса.
+    :param use_cache:
+        Использовать дисковый кэш, если он включен.
+
+    :return:
+        Конкретная таблица из запроса.
+    """
+    query = query or {}
+    file_cache = disk_cache.get_cache() if use_cache else None
+    if file_cache is None:
+        iss = client.AsyncISSClient(session, url, query)
+        return _get_table(await iss.get(), table)
+
+    # Чтение и запись кэша выполняются в отдельном потоке, чтобы не блокировать цикл событий
+    rows, missing_query = await asyncio.to_thread(file_cache.lookup, url, query)
+    if missing_query is not None:
+        iss = client.AsyncISSClient(session, url, missing_query)
+        rows = _get_table(await iss.get(), table)
+        await asyncio.to_thread(file_cache.store, url, query, rows)
+
+    return rows
+
+
+async def _get_long_data(
+    session: Session,
+    url: str,
+    table: str,
+    query: client.WebQuery | None = None,
+    *,
+    use_cache: bool = True,
+) -> client.Table:
+    """Получить данные для запроса, в котором информация выдается несколькими блоками.
+
+    :param session:
+        Сессия интернет соединения.
+    :param url:
+        URL запроса.
+    :param table:
+        Таблица, которую нужно выбрать.
+    :param query:
+        Дополнительные параметры запроса.
+    :param use_cache:
+        Использовать дисковый кэш, если он включен.
+
+    :return:
+        Конкретная таблица из запроса.
+    """
+    query = query or {}
+    file_cache = disk_cache.get_cache() if use_cache else None
+    if file_cache is None:
+        iss = client.AsyncISSClient(session, url, query)
+        return _get_table(await iss.get_all(), table)
+
+    date_column = disk_cache.DATE_COLUMNS.get(table)
+    rows, missing_query = await asyncio.to_thread(file_cache.lookup, url, query, date_column)
+    if missing_query is not None:
+        iss = client.AsyncISSClient(session, url, missing_query)
+        rows.extend(_get_table(await iss.get_all(), table))
+        await asyncio.to_thread(file_cache.store, url, query, rows, date_column)
+
+    return rows
+
+
+async def get_reference(
+    session: Session,
+    placeholder: str = "boards",
+    *,
+    cache: bool = True,
+) -> list[dict[str, str | int | float]]:
+    """Получить перечень доступных значений плейсхолдера в адресе запроса.
+
+    Асинхронный аналог apimoex.get_reference.
+    """
+    url = f"{_ISS_URL}/index.json"
+
+    return await _get_short_data(session, url, placeholder, use_cache=cache)
+
+
+async def find_securities(
+    session: Session,
+    string: str,
+    columns: tuple[str, ...] | None = _SECURITIES_COLS,
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Найти инструменты по части Кода, Названию, ISIN, Идентификатору Эмитента, Номеру гос.регистрации.
+
+    Асинхронный аналог apimoex.find_securities.
+    """
+    url = f"{_ISS_URL}/securities.json"
+    table = "securities"
+    query = _make_query(q=string, table=table, columns=columns)
+
+    return await _get_short_data(session, url, table, query, use_cache=cache)
+
+
+async def find_security_description(
+    session: Session,
+    security: str,
+    columns: tuple[str, ...] | None = _DESCRIPTION_COLS,
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Получить спецификацию инструмента.
+
+    Асинхронный аналог apimoex.find_security_description.
+    """
+    url = f"{_ISS_URL}/securities/{security}.json"
+    table = "description"
+    query = _make_query(table=table, columns=columns)
+
+    return await _get_short_data(session, url, table, query, use_cache=cache)
+
+
+async def get_market_candle_borders(
+    session: Session,
+    security: str,
+    market: str = "shares",
+    engine: str = "stock",
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Получить таблицу интервалов доступных дат для свечей различного размера на рынке для всех режимов торгов.
+
+    Асинхронный аналог apimoex.get_market_candle_borders.
+    """
+    url = f"{_ISS_URL}/engines/{engine}/markets/{market}/securities/{security}/candleborders.json"
+    table = "borders"
+
+    return await _get_short_data(session, url, table, use_cache=cache)
+
+
+async def get_board_candle_borders(
+    session: Session,
+    security: str,
+    board: str = "TQBR",
+    market: str = "shares",
+    engine: str = "stock",
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Получить таблицу интервалов доступных дат для свечей различного размера в указанном режиме торгов.
+
+    Асинхронный аналог apimoex.get_board_candle_borders.
+    """
+    url = f"{_ISS_URL}/engines/{engine}/markets/{market}/boards/{board}/securities/{security}/candleborders.json"
+    table = "borders"
+
+    return await _get_short_data(session, url, table, use_cache=cache)
+
+
+async def get_market_candles(
+    session: Session,
+    security: str,
+    interval: int = 24,
+    start: str | None = None,
+    end: str | None = None,
+    columns: tuple[str, ...] | None = _CANDLE_COLS,
+    market: str = "shares",
+    engine: str = "stock",
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Получить свечи в формате HLOCV указанного инструмента на рынке для основного режима торгов за интервал дат.
+
+    Асинхронный аналог apimoex.get_market_candles.
+    """
+    url = f"{_ISS_URL}/engines/{engine}/markets/{market}/securities/{security}/candles.json"
+    table = "candles"
+    query = _make_query(interval=interval, start=start, end=end, table=table, columns=columns)
+
+    return await _get_long_data(session, url, table, query, use_cache=cache)
+
+
+async def get_board_candles(
+    session: Session,
+    security: str,
+    interval: int = 24,
+    start: str | None = None,
+    end: str | None = None,
+    columns: tuple[str, ...] | None = _CANDLE_COLS,
+    board: str = "TQBR",
+    market: str = "shares",
+    engine: str = "stock",
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Получить свечи в формате HLOCV указанного инструмента в указанном режиме торгов за интервал дат.
+
+    Асинхронный аналог apimoex.get_board_candles.
+    """
+    url = f"{_ISS_URL}/engines/{engine}/markets/{market}/boards/{board}/securities/{security}/candles.json"
+    table = "candles"
+    query = _make_query(interval=interval, start=start, end=end, table=table, columns=columns)
+
+    return await _get_long_data(session, url, table, query, use_cache=cache)
+
+
+async def get_board_dates(
+    session: Session,
+    board: str = "TQBR",
+    market: str = "shares",
+    engine: str = "stock",
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Получить интервал дат, доступных в истории для рынка по заданному режиму торгов.
+
+    Асинхронный аналог apimoex.get_board_dates.
+    """
+    url = f"{_ISS_URL}/history/engines/{engine}/markets/{market}/boards/{board}/dates.json"
+    table = "dates"
+
+    return await _get_short_data(session, url, table, use_cache=cache)
+
+
+async def get_board_securities(
+    session: Session,
+    table: str = "securities",
+    columns: tuple[str, ...] | None = _BOARD_SECURITIES_COLS,
+    board: str = "TQBR",
+    market: str = "shares",
+    engine: str = "stock",
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Получить таблицу инструментов по режиму торгов со вспомогательной информацией.
+
+    Асинхронный аналог apimoex.get_board_securities.
+    """
+    url = f"{_ISS_URL}/engines/{engine}/markets/{market}/boards/{board}/securities.json"
+    query = _make_query(table=table, columns=columns)
+
+    return await _get_short_data(session, url, table, query, use_cache=cache)
+
+
+async def get_market_history(
+    session: Session,
+    security: str,
+    start: str | None = None,
+    end: str | None = None,
+    columns: tuple[str, ...] | None = _HISTORY_COLS,
+    market: str = "shares",
+    engine: str = "stock",
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Получить историю по одной бумаге на рынке для всех режимов торгов за интервал дат.
+
+    Асинхронный аналог apimoex.get_market_history.
+    """
+    url = f"{_ISS_URL}/history/engines/{engine}/markets/{market}/securities/{security}.json"
+    table = "history"
+    query = _make_query(start=start, end=end, table=table, columns=columns)
+
+    return await _get_long_data(session, url, table, query, use_cache=cache)
+
+
+async def get_board_history(
+    session: Session,
+    security: str,
+    start: str | None = None,
+    end: str | None = None,
+    columns: tuple[str, ...] | None = _HISTORY_COLS,
+    board: str = "TQBR",
+    market: str = "shares",
+    engine: str = "stock",
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Получить историю торгов для указанной бумаги в указанном режиме торгов за указанный интервал дат.
+
+    Асинхронный аналог apimoex.get_board_history.
+    """
+    url = f"{_ISS_URL}/history/engines/{engine}/markets/{market}/boards/{board}/securities/{security}.json"
+    table = "history"
+    query = _make_query(start=start, end=end, table=table, columns=columns)
+
+    return await _get_long_data(session, url, table, query, use_cache=cache)
+
+
+async def get_index_tickers(
+    session: Session,
+    index: str,
+    date: str | None = None,
+    columns: tuple[str, ...] | None = _INDEX_TICKERS_COLS,
+    market: str = "index",
+    engine: str = "stock",
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Получить информацию по составу указанного индекса за указанную дату.
+
+    Асинхронный аналог apimoex.get_index_tickers.
+    """
+    url = f"{_ISS_URL}/statistics/engines/{engine}/markets/{market}/analytics/{index}/tickers.json"
+    table = "tickers"
+    query = _make_query(date=date, table=table, columns=columns)
+
+    return await _get_short_data(session, url, table, query, use_cache=cache)
+
+
+async def get_board_today_trades(
+    session: Session,
+    security: str,
+    tradeno: str = "",
+    columns: tuple[str, ...] | None = _TRADES_COLS,
+    board: str = "TQBR",
+    market: str = "shares",
+    engine: str = "stock",
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Получить сделки указанного инструмента в указанном режиме торгов за сегодня.
+
+    Асинхронный аналог apimoex.get_board_today_trades.
+    """
+    url = f"{_ISS_URL}/engines/{engine}/markets/{market}/boards/{board}/securities/{security}/trades.json"
+    table = "trades"
+    query = _make_query(tradeno=tradeno, table=table, columns=columns)
+
+    return await _get_long_data(session, url, table, query, use_cache=cache)
+
+
+async def authenticate(session: aiohttp.ClientSession, username: str, password: str) -> bool:
+    """Аутентификация пользователя для доступа к данным, требующим авторизации ISS MOEX.
+
+    Асинхронный аналог apimoex.authenticate. Cookie MicexPassportCert сохраняется в сессии.
+    """
+    if bucket := ratelimit.get_bucket(_PASSPORT_URL):
+        await bucket.acquire_async()
+    async with session.get(_PASSPORT_URL, headers=_basic_auth_header(username, password)) as respond:
+        return respond.status == HTTPStatus.OK
+
+
+async def get_tradestats(
+    session: Session,
+    security: str,
+    start: str | None = None,
+    end: str | None = None,
+    columns: tuple[str, ...] | None = _TRADESTATS_COLS,
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Метрики рассчитанные на основе потока сделок (tradestats). Требуется авторизация ISS MOEX.
+
+    Асинхронный аналог apimoex.get_tradestats.
+    """
+    url = f"{_ISS_URL}/datashop/algopack/eq/tradestats/{security}.json"
+    table = "data"
+    query = _make_query(start=start, end=end, table=table, columns=columns)
+
+    return await _get_long_data(session, url, table, query, use_cache=cache)
+
+
+async def get_orderstats(
+    session: Session,
+    security: str,
+    start: str | None = None,
+    end: str | None = None,
+    columns: tuple[str, ...] | None = _ORDERSTATS_COLS,
+    *,
+    cache: bool = True,
+) -> client.Table:
+    """Метрики рассчитанные на основе потока заявок (orderstats). Требуется авторизация ISS MOEX.
+
+    Асинхронный аналог apimoex.get_orderstats.
+    """
+    url = f"{_ISS_URL}/datashop/algopack/eq/orderstats/{security}.json"
+    table = "data"
+    query = _make_query(start=start, end=end, table=table, columns=columns)
+
+    return await _get_long_data(session, url, table, query, use_cache=cache)
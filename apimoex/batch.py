@@ -0,0 +1,154 @@
+"""Одновременная загрузка данных для нескольких инструментов.
+
+Запросы по отдельным инструментам выполняются параллельно в пуле потоков с использованием общей сессии, поэтому
+сессия должна быть создана с помощью apimoex.make_session() и поддерживать достаточное количество одновременных
+соединений.
+"""
+import functools
+from collections import abc
+from concurrent import futures
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from apimoex import client
+from apimoex import requests as moex_requests
+
+__all__ = [
+    "get_many_board_history",
+    "get_many_market_candles",
+    "get_many_tradestats",
+]
+
+# Количество потоков по умолчанию
+MAX_WORKERS = 8
+
+
+def _check_pool_size(session: client.Session, max_workers: int) -> None:
+    """Проверяет, что пул соединений сессии позволяет осуществлять необходимое количество одновременных запросов."""
+    if not isinstance(session, requests.Session):
+        return
+
+    adapter = session.get_adapter("https://iss.moex.com")
+    if not isinstance(adapter, HTTPAdapter):
+        return
+
+    pool_maxsize = adapter.poolmanager.connection_pool_kw.get("maxsize", 1)
+    if pool_maxsize < max_workers:
+        raise client.ISSMoexError(
+            f"Размер пула соединений {pool_maxsize} меньше количества потоков {max_workers} - "
+            "используйте apimoex.make_session()",
+        )
+
+
+def _get_many(
+    request: abc.Callable[..., client.Table],
+    session: client.Session,
+    securities: abc.Iterable[str],
+    max_workers: int,
+    kwargs: dict[str, Any],
+) -> dict[str, client.Table]:
+    """Выполняет запрос для каждого из инструментов в пуле потоков.
+
+    :param request:
+        Функция-запрос, первыми аргументами которой являются сессия и тикер.
+    :param session:
+        Сессия интернет соединения.
+    :param securities:
+        Тикеры ценных бумаг.
+    :param max_workers:
+        Количество потоков.
+    :param kwargs:
+        Дополнительные параметры функции-запроса.
+
+    :return:
+        Словарь с результатами запроса для каждого тикера.
+    """
+    _check_pool_size(session, max_workers)
+    securities = list(securities)
+    with futures.ThreadPoolExecutor(max_workers) as executor:
+        tables = executor.map(functools.partial(request, session, **kwargs), securities)
+
+        return dict(zip(securities, tables, strict=True))
+
+
+def get_many_board_history(
+    session: client.Session,
+    securities: abc.Iterable[str],
+    max_workers: int = MAX_WORKERS,
+    **kwargs: Any,  # noqa: ANN401
+) -> dict[str, client.Table]:
+    """Получить историю торгов для нескольких бумаг в указанном режиме торгов за указанный интервал дат.
+
+    Запросы для разных бумаг осуществляются одновременно.
+
+    :param session:
+        Сессия интернет соединения, созданная с помощью apimoex.make_session(). Размер пула соединений сессии должен
+        быть не меньше количества потоков.
+    :param securities:
+        Тикеры ценных бумаг.
+    :param max_workers:
+        Количество одновременных запросов.
+    :param kwargs:
+        Дополнительные параметры apimoex.get_board_history().
+
+    :return:
+        Словарь, ключами которого являются тикеры, а значениями - списки словарей, которые напрямую конвертируются в
+        pandas.DataFrame.
+    """
+    return _get_many(moex_requests.get_board_history, session, securities, max_workers, kwargs)
+
+
+def get_many_market_candles(
+    session: client.Session,
+    securities: abc.Iterable[str],
+    max_workers: int = MAX_WORKERS,
+    **kwargs: Any,  # noqa: ANN401
+) -> dict[str, client.Table]:
+    """Получить свечи в формате HLOCV для нескольких бумаг на рынке для основного режима торгов за интервал дат.
+
+    Запросы для разных бумаг осуществляются одновременно.
+
+    :param session:
+        Сессия интернет соединения, созданная с помощью apimoex.make_session(). Размер пула соединений сессии должен
+        быть не меньше количества потоков.
+    :param securities:
+        Тикеры ценных бумаг.
+    :param max_workers:
+        Количество одновременных запросов.
+    :param kwargs:
+        Дополнительные параметры apimoex.get_market_candles().
+
+    :return:
+        Словарь, ключами которого являются тикеры, а значениями - списки словарей, которые напрямую конвертируются в
+        pandas.DataFrame.
+    """
+    return _get_many(moex_requests.get_market_candles, session, securities, max_workers, kwargs)
+
+
+def get_many_tradestats(
+    session: client.Session,
+    securities: abc.Iterable[str],
+    max_workers: int = MAX_WORKERS,
+    **kwargs: Any,  # noqa: ANN401
+) -> dict[str, client.Table]:
+    """Получить метрики на основе потока сделок (tradestats) для нескольких бумаг. Требуется авторизация ISS MOEX.
+
+    Запросы для разных бумаг осуществляются одновременно.
+
+    :param session:
+        Сессия интернет соединения, созданная с помощью apimoex.make_session() и прошедшая авторизацию с помощью
+        apimoex.authenticate(). Размер пула соединений сессии должен быть не меньше количества потоков.
+    :param securities:
+        Тикеры ценных бумаг.
+    :param max_workers:
+        Количество одновременных запросов.
+    :param kwargs:
+        Дополнительные параметры apimoex.get_tradestats().
+
+    :return:
+        Словарь, ключами которого являются тикеры, а значениями - списки словарей, которые напрямую конвертируются в
+        pandas.DataFrame.
+    """
+    return _get_many(moex_requests.get_tradestats, session, securities, max_workers, kwargs)
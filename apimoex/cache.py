@@ -0,0 +1,293 @@
+"""Дисковый кэш ответов MOEX ISS.
+
+По умолчанию кэш выключен и включается с помощью configure_cache(). Данные хранятся в формате parquet, поэтому для
+работы кэша необходимо установить дополнительные зависимости:
+
+    $ pip install apimoex[cache]
+
+Ответы на запросы с конечной датой в прошлом (till или date) не меняются после закрытия торгов, поэтому хранятся
+бессрочно, остальные - в течение времени жизни по умолчанию.
+"""
+import datetime
+import hashlib
+import json
+import math
+import os
+import pathlib
+import threading
+import time
+from typing import Any, cast
+from zoneinfo import ZoneInfo
+
+from apimoex import client
+
+# Переменная окружения с путем к директории кэша
+CACHE_DIR_ENV = "APIMOEX_CACHE_DIR"
+DEFAULT_CACHE_DIR = pathlib.Path.home() / ".apimoex" / "cache"
+# Время жизни в секундах для данных, которые могут измениться - например, данных текущего дня
+DEFAULT_TTL = 60 * 60
+# Время жизни неизменных исторических данных
+FOREVER = math.inf
+# Файл с перечнем сохраненных интервалов дат
+MANIFEST = "manifest.parquet"
+# Столбцы с датой для таблиц, загружаемых за интервал дат
+DATE_COLUMNS = {"history": "TRADEDATE", "candles": "begin"}
+# Интервалы свечей, которые заканчиваются в пределах одного дня. Недельные (7), месячные (31) и квартальные (4) свечи
+# за незавершенный период неполны, поэтому сохраненные интервалы для них не используются
+RANGE_INTERVALS = (1, 10, 60, 24)
+# Часовой пояс MOEX - торговые дни определяются по московскому времени
+MOEX_TZ = ZoneInfo("Europe/Moscow")
+
+
+class FileCache:
+    """Дисковый кэш таблиц с ответами MOEX ISS.
+
+    Каждый ответ хранится в отдельном parquet файле, имя которого является хэшем адреса и параметров запроса. Для
+    ответов за интервалы дат в прошлом ведется перечень сохраненных интервалов, что позволяет при расширении интервала
+    загружать с сервера только недостающие данные.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], default_ttl: float = DEFAULT_TTL) -> None:
+        """Директория создается при необходимости.
+
+        :param path:
+            Директория для хранения кэша.
+        :param default_ttl:
+            Время жизни в секундах для данных, которые могут измениться.
+        """
+        self._path = pathlib.Path(path).expanduser()
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._default_ttl = default_ttl
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Наименование класса, директория и время жизни данных."""
+        return f"{self.__class__.__name__}(path={self._path}, default_ttl={self._default_ttl})"
+
+    @staticmethod
+    def make_key(url: str, query: client.WebQuery) -> str:
+        """Ключ кэша, однозначно определяемый адресом и параметрами запроса."""
+        raw = url.encode() + json.dumps(query, sort_keys=True).encode()
+
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def ttl(self, query: client.WebQuery, saved_at: float | None = None) -> float:
+        """Время жизни данных для запроса.
+
+        Данные неизменны, если на момент сохранения запрос был ограничен датой в прошлом по московскому времени. Данные,
+        сохраненные в день окончания запроса или раньше, могут быть неполными и хранятся лишь в течение времени жизни по
+        умолчанию.
+
+        :param query:
+            Параметры запроса.
+        :param saved_at:
+            Момент сохранения данных в секундах с начала эпохи. По умолчанию текущий момент.
+        """
+        end = query.get("till") or query.get("date")
+        saved_at = time.time() if saved_at is None else saved_at
+        saved_date = datetime.datetime.fromtimestamp(saved_at, tz=MOEX_TZ).date().isoformat()
+        if isinstance(end, str) and end < saved_date:
+            return FOREVER
+
+        return self._default_ttl
+
+    def load(self, url: str, query: client.WebQuery) -> client.Table | None:
+        """Загрузить таблицу из кэша.
+
+        :return:
+            Таблица или None, если она отсутствует в кэше или устарела.
+        """
+        path = self._path / f"{self.make_key(url, query)}.parquet"
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if mtime + self.ttl(query, mtime) <= time.time():
+            return None
+
+        return _read(path)
+
+    def save(self, url: str, query: client.WebQuery, table: client.Table) -> bool:
+        """Сохранить таблицу в кэш.
+
+        Таблицы, которые не могут быть представлены в формате parquet (например, со столбцами смешанного типа), не
+        сохраняются.
+
+        :return:
+            True, если таблица сохранена.
+        """
+        return _write(self._path / f"{self.make_key(url, query)}.parquet", table)
+
+    def lookup(
+        self,
+        url: str,
+        query: client.WebQuery,
+        date_column: str | None = None,
+    ) -> tuple[client.Table, client.WebQuery | None]:
+        """Найти в кэше данные для запроса.
+
+        Для запросов с интервалом дат при отсутствии точного совпадения используются сохраненные данные за интервал,
+        содержащий начальную дату запроса, - загрузить с сервера нужно только данные после конца этого интервала.
+
+        :param url:
+            Адрес запроса.
+        :param query:
+            Параметры запроса.
+        :param date_column:
+            Столбец с датой, по которому отбираются строки из сохраненного интервала. Если None или запрошены свечи за
+            неделю, месяц или квартал, то ищется только точное совпадение.
+
+        :return:
+            Найденные в кэше строки и параметры запроса для загрузки недостающих данных или None, если все данные
+            найдены в кэше.
+        """
+        rows = self.load(url, query)
+        if rows is not None:
+            return rows, None
+        if date_column is None or not _supports_ranges(query):
+            return [], query
+
+        return self._lookup_range(url, query, date_column)
+
+    def store(
+        self,
+        url: str,
+        query: client.WebQuery,
+        table: client.Table,
+        date_column: str | None = None,
+    ) -> None:
+        """Сохранить таблицу в кэш.
+
+        Неизменные данные за интервал дат дополнительно регистрируются для использования при запросах с пересекающимся
+        интервалом.
+        """
+        if not self.save(url, query, table) or date_column is None or not _supports_ranges(query):
+            return
+        if "till" in query and self.ttl(query) == FOREVER:
+            self._register_range(url, query)
+
+    def _lookup_range(
+        self,
+        url: str,
+        query: client.WebQuery,
+        date_column: str,
+    ) -> tuple[client.Table, client.WebQuery | None]:
+        """Поиск сохраненного интервала, содержащего начальную дату запроса."""
+        start = str(query.get("from", ""))
+        end = query.get("till")
+        key = self._make_range_key(url, query)
+        entries = [
+            entry for entry in self._read_manifest() if entry["key"] == key and entry["from"] <= start <= entry["till"]
+        ]
+        if not entries:
+            return [], query
+
+        entry = max(entries, key=lambda item: item["till"])
+        rows = _read(self._path / entry["file"])
+        if rows is None or (rows and date_column not in rows[0]):
+            return [], query
+
+        # Дата занимает первые 10 символов - у свечей к ней добавляется время
+        rows = [
+            row
+            for row in rows
+            if start <= str(row[date_column])[:10] and (end is None or str(row[date_column])[:10] <= str(end))
+        ]
+        if end is not None and str(end) <= entry["till"]:
+            return rows, None
+
+        next_day = datetime.date.fromisoformat(entry["till"]) + datetime.timedelta(days=1)
+
+        return rows, {**query, "from": next_day.isoformat()}
+
+    def _register_range(self, url: str, query: client.WebQuery) -> None:
+        """Добавить интервал дат запроса в перечень сохраненных интервалов."""
+        entry = {
+            "key": self._make_range_key(url, query),
+            "from": str(query.get("from", "")),
+            "till": str(query["till"]),
+            "file": f"{self.make_key(url, query)}.parquet",
+        }
+        with self._lock:
+            manifest = [row for row in self._read_manifest() if row != entry]
+            manifest.append(entry)
+            _write(self._path / MANIFEST, manifest)
+
+    def _read_manifest(self) -> list[dict[str, str]]:
+        """Перечень сохраненных интервалов дат с ключом запроса без дат, границами интервала и файлом с данными."""
+        return cast(list[dict[str, str]], _read(self._path / MANIFEST) or [])
+
+    def _make_range_key(self, url: str, query: client.WebQuery) -> str:
+        """Ключ запроса без учета интервала дат."""
+        return self.make_key(url, {key: value for key, value in query.items() if key not in ("from", "till")})
+
+
+def _supports_ranges(query: client.WebQuery) -> bool:
+    """Можно ли использовать сохраненные интервалы дат для запроса - для истории и свечей не длиннее дня."""
+    return "interval" not in query or query["interval"] in RANGE_INTERVALS
+
+
+def _read(path: pathlib.Path) -> client.Table | None:
+    """Прочитать таблицу из parquet файла или None, если файл отсутствует."""
+    from pyarrow import parquet  # pyright: ignore[reportMissingTypeStubs]
+
+    if not path.exists():
+        return None
+
+    return cast(client.Table, parquet.read_table(path).to_pylist())  # pyright: ignore[reportUnknownMemberType]
+
+
+def _write(path: pathlib.Path, table: list[dict[str, Any]]) -> bool:
+    """Атомарно записать таблицу в parquet файл.
+
+    :return:
+        True, если таблица может быть представлена в формате parquet и записана.
+    """
+    import pyarrow as pa  # pyright: ignore[reportMissingTypeStubs]
+    from pyarrow import parquet  # pyright: ignore[reportMissingTypeStubs]
+
+    try:
+        arrow_table = pa.Table.from_pylist(table)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    except pa.ArrowException:  # pyright: ignore[reportUnknownMemberType]
+        return False
+
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    parquet.write_table(arrow_table, tmp_path)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+    tmp_path.replace(path)
+
+    return True
+
+
+_cache: FileCache | None = None
+
+
+def configure_cache(
+    *,
+    enabled: bool = True,
+    path: str | os.PathLike[str] | None = None,
+    default_ttl: float = DEFAULT_TTL,
+) -> None:
+    """Включить или выключить дисковый кэш ответов MOEX ISS.
+
+    :param enabled:
+        Включить кэш.
+    :param path:
+        Директория для хранения кэша. По умолчанию берется из переменной окружения APIMOEX_CACHE_DIR, а при ее
+        отсутствии используется ~/.apimoex/cache.
+    :param default_ttl:
+        Время жизни в секундах для данных, которые могут измениться - например, данных текущего дня. Данные запросов,
+        ограниченных датой в прошлом, хранятся бессрочно.
+    """
+    global _cache  # noqa: PLW0603
+
+    if not enabled:
+        _cache = None
+        return
+
+    path = path or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR
+    _cache = FileCache(path, default_ttl)
+
+
+def get_cache() -> FileCache | None:
+    """Текущий кэш или None, если кэш выключен."""
+    return _cache
@@ -1,9 +1,27 @@
 """Клиент для MOEX ISS."""
+import asyncio
+import weakref
 from collections import abc
-from typing import cast
+from typing import TYPE_CHECKING, Any, Protocol, cast, runtime_checkable
 
 import requests
 
+from apimoex import ratelimit
+
+# Бэкенды ijson на C - чисто Python реализация разбирает ответы в разы медленнее стандартного json
+_FAST_IJSON_BACKENDS = ("yajl2_c", "yajl2_cffi")
+
+try:
+    import ijson  # pyright: ignore[reportMissingTypeStubs]
+except ImportError:
+    ijson = None
+else:
+    if ijson.backend not in _FAST_IJSON_BACKENDS:
+        ijson = None
+
+if TYPE_CHECKING:
+    import aiohttp
+
 Values = str | int | float
 TableRow = dict[str, Values]
 Table = list[TableRow]
@@ -11,22 +29,139 @@ TablesDict = dict[str, Table]
 WebQuery = dict[str, str | int]
 
 BASE_QUERY = {"iss.json": "extended", "iss.meta": "off"}
+# Ограничение на количество одновременных асинхронных запросов, чтобы не упираться в ограничения MOEX ISS
+MAX_CONCURRENT_REQUESTS = 8
+
+_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
 
 
 class ISSMoexError(Exception):
     """Базовое исключение."""
 
 
+@runtime_checkable
+class Transport(Protocol):
+    """Транспорт для осуществления запросов ISSClient без использования requests.Session.
+
+    Например, apimoex.http2.HTTP2Session для работы по протоколу HTTP/2.
+    """
+
+    def fetch(self, url: str, params: WebQuery) -> tuple[str, list[Any]]:
+        """Загружает ответ и разбирает json.
+
+        При ошибочном статусе ответа должно возбуждаться ISSMoexError.
+
+        :return:
+            Итоговый адрес запроса с параметрами и разобранный json ответа.
+        """
+        ...
+
+
+@runtime_checkable
+class AsyncTransport(Protocol):
+    """Транспорт для осуществления запросов AsyncISSClient без использования aiohttp.ClientSession.
+
+    Например, apimoex.http2.AsyncHTTP2Session для работы по протоколу HTTP/2.
+    """
+
+    async def afetch(self, url: str, params: WebQuery) -> tuple[str, list[Any]]:
+        """Асинхронно загружает ответ и разбирает json аналогично Transport.fetch.
+
+        Имя метода отличается от Transport.fetch, чтобы синхронный и асинхронный транспорты различались при проверке
+        isinstance.
+        """
+        ...
+
+
+Session = requests.Session | Transport
+
+
+def _next_start(data: TablesDict, start: int) -> int | None:
+    """Начальная позиция следующего блока данных или None, если блок последний.
+
+    При наличии в данных курсора history.cursor он проверяется и удаляется из данных.
+    """
+    if "history.cursor" in data:
+        cursor, *wrong_data = data["history.cursor"]
+        if len(wrong_data) != 0 or cursor["INDEX"] != start:
+            raise ISSMoexError(
+                f"Некорректные данные history.cursor {data['history.cursor']} для начальной позиции {start}"
+            )
+        del data["history.cursor"]
+        start += cast(int, cursor["PAGESIZE"])
+        if start >= cast(int, cursor["TOTAL"]):
+            return None
+        return start
+
+    # Наименование ключа может быть любым
+    key = next(iter(data))
+    block_size = len(data[key])
+    if not block_size:
+        return None
+    return start + block_size
+
+
+def _fetch(session: requests.Session, url: str, query: WebQuery) -> tuple[str, list[Any]]:
+    """Загружает ответ с помощью requests.Session и разбирает json."""
+    with session.get(url, params=query, stream=True) as respond:
+        try:
+            respond.raise_for_status()
+        except requests.HTTPError as err:
+            raise ISSMoexError("Неверный url", respond.url) from err
+        else:
+            return respond.url, _load_json(respond)
+
+
+async def _fetch_async(session: "aiohttp.ClientSession", url: str, query: WebQuery) -> tuple[str, list[Any]]:
+    """Асинхронно загружает ответ с помощью aiohttp.ClientSession и разбирает json."""
+    async with session.get(url, params=query) as respond:
+        if not respond.ok:
+            raise ISSMoexError("Неверный url", str(respond.url))
+        return str(respond.url), await _load_json_async(respond)
+
+
+def _load_json(respond: requests.Response) -> list[Any]:
+    """Разбор json ответа.
+
+    При наличии ijson с бэкендом на C ответ разбирается по мере загрузки без предварительного сохранения тела ответа в
+    памяти. Разобранный блок данных при этом целиком хранится в памяти, поэтому экономится лишь буфер с телом ответа.
+    """
+    if ijson is None:
+        return respond.json()
+
+    respond.raw.decode_content = True
+
+    return list(ijson.items(respond.raw, "item", use_float=True))
+
+
+async def _load_json_async(respond: "aiohttp.ClientResponse") -> list[Any]:
+    """Асинхронный разбор json ответа аналогично _load_json."""
+    if ijson is None:
+        return await respond.json()
+
+    return [item async for item in ijson.items(respond.content, "item", use_float=True)]
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Семафор, ограничивающий количество одновременных запросов в рамках текущего цикла событий."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return semaphore
+
+
 class ISSClient(abc.Iterable[TablesDict]):
     """Клиент для MOEX ISS.
 
-    Для работы клиента необходимо передать requests.Session.
+    Для работы клиента необходимо передать requests.Session или другой транспорт, поддерживающий протокол Transport.
 
     Загружает данные для простых ответов с помощью метода get. Для ответов состоящих из нескольких блоков данных
-    поддерживается протокол итерируемого для отдельных блоков или метод get_all для их автоматического сбора.
+    поддерживается протокол итерируемого для отдельных блоков или метод get_all для их автоматического сбора. Частота
+    запросов ограничивается с помощью apimoex.configure_rate_limit().
     """
 
-    def __init__(self, session: requests.Session, url: str, query: WebQuery | None = None) -> None:
+    def __init__(self, session: Session, url: str, query: WebQuery | None = None) -> None:
         """MOEX ISS является REST сервером.
 
         Полный перечень запросов и параметров к ним https://iss.moex.com/iss/reference/
@@ -43,6 +178,8 @@ class ISSClient(abc.Iterable[TablesDict]):
         self._session = session
         self._url = url
         self._query = query or {}
+        # Общие для всех блоков данных параметры формируются один раз и не изменяются
+        self._page_query: WebQuery = {**BASE_QUERY, **self._query}
 
     def __repr__(self) -> str:
         """Наименование класса и содержание запроса к ISS Moex."""
@@ -59,28 +196,17 @@ class ISSClient(abc.Iterable[TablesDict]):
         Ответ представляет словарь, каждый из ключей которого отдельная таблица с данными. Таблица представлена в виде
         списка словарей, где каждый ключ словаря соответствует отдельному столбцу.
         """
+        # Словарь с параметрами принадлежит генератору, поэтому для загрузки следующих блоков меняется только начальная
+        # позиция, а одновременные вызовы get() не затрагиваются
+        query = self._make_query()
         start = 0
         while True:
-            data = self.get(start)
-            if "history.cursor" in data:
-                cursor, *wrong_data = data["history.cursor"]
-                if len(wrong_data) != 0 or cursor["INDEX"] != start:
-                    raise ISSMoexError(
-                        f"Некорректные данные history.cursor {data['history.cursor']} для начальной позиции {start}"
-                    )
-                del data["history.cursor"]
-                yield data
-                start += cast(int, cursor["PAGESIZE"])
-                if start >= cast(int, cursor["TOTAL"]):
-                    return
-            else:
-                # Наименование ключа может быть любым
-                key = next(iter(data))
-                block_size = len(data[key])
-                yield data
-                if not block_size:
-                    return
-                start += block_size
+            data = self._get(query)
+            next_start = _next_start(data, start)
+            yield data
+            if next_start is None:
+                return
+            start = query["start"] = next_start
 
     def get(self, start: int | None = None) -> dict[str, list[dict[str, str | int | float]]]:
         """Загрузка данных.
@@ -93,25 +219,32 @@ class ISSClient(abc.Iterable[TablesDict]):
             соответствует одной из таблиц с данными. Таблицы являются списками словарей, которые напрямую конвертируются
             в pandas.DataFrame.
         """
-        query = self._make_query(start)
-        with self._session.get(self._url, params=query) as respond:
-            try:
-                respond.raise_for_status()
-            except requests.HTTPError as err:
-                raise ISSMoexError("Неверный url", respond.url) from err
-            else:
-                _, data, *wrong_data = respond.json()
+        return self._get(self._make_query(start))
+
+    def _get(self, query: WebQuery) -> TablesDict:
+        """Загрузка блока данных с заданными параметрами запроса."""
+        if bucket := ratelimit.get_bucket(self._url):
+            bucket.acquire()
+        if isinstance(self._session, Transport):
+            url, raw = self._session.fetch(self._url, query)
+        else:
+            url, raw = _fetch(self._session, self._url, query)
+        _, data, *wrong_data = raw
         if len(wrong_data) != 0:
-            raise ISSMoexError("Ответ содержит некорректные данные", respond.url)
+            raise ISSMoexError("Ответ содержит некорректные данные", url)
         return data
 
     def _make_query(self, start: int | None = None) -> WebQuery:
-        """К общему набору параметров запроса добавляется требование предоставить ответ в виде расширенного json."""
-        query: WebQuery = dict(**BASE_QUERY, **self._query)
+        """К общему набору параметров запроса добавляется требование предоставить ответ в виде расширенного json.
+
+        Общий набор параметров не изменяется, а для каждого вызова создается новый словарь, поэтому клиент может
+        одновременно использоваться для загрузки нескольких блоков данных. При последовательной загрузке всех блоков
+        один словарь используется для всех запросов.
+        """
         if start:
-            query["start"] = start
+            return {**self._page_query, "start": start}
 
-        return query
+        return {**self._page_query}
 
     def get_all(self) -> TablesDict:
         """Собирает все блоки данных для запросов, ответы на которые выдаются по частям отдельными блоками.
@@ -128,3 +261,112 @@ class ISSClient(abc.Iterable[TablesDict]):
                 all_data.setdefault(key, []).extend(value)
 
         return all_data
+
+
+class AsyncISSClient(abc.AsyncIterable[TablesDict]):
+    """Асинхронный клиент для MOEX ISS.
+
+    Для работы клиента необходимо передать aiohttp.ClientSession или другой транспорт, поддерживающий протокол
+    AsyncTransport.
+
+    Повторяет интерфейс ISSClient, но все методы загрузки являются корутинами, что позволяет осуществлять несколько
+    запросов одновременно. Количество одновременных запросов ограничено MAX_CONCURRENT_REQUESTS.
+    """
+
+    def __init__(
+        self,
+        session: "aiohttp.ClientSession | AsyncTransport",
+        url: str,
+        query: WebQuery | None = None,
+    ) -> None:
+        """MOEX ISS является REST сервером.
+
+        Полный перечень запросов и параметров к ним https://iss.moex.com/iss/reference/
+        Дополнительное описание https://fs.moex.com/files/6523
+
+        :param session:
+            Сессия интернет соединения.
+        :param url:
+            Адрес запроса.
+        :param query:
+            Перечень дополнительных параметров запроса. К списку дополнительных параметров всегда добавляется
+            требование предоставить ответ в виде расширенного json без метаданных.
+        """
+        self._session = session
+        self._url = url
+        self._query = query or {}
+        # Общие для всех блоков данных параметры формируются один раз и не изменяются
+        self._page_query: WebQuery = {**BASE_QUERY, **self._query}
+
+    def __repr__(self) -> str:
+        """Наименование класса и содержание запроса к ISS Moex."""
+        return f"{self.__class__.__name__}(url={self._url}, query={self._query})"
+
+    async def __aiter__(self) -> abc.AsyncIterator[TablesDict]:
+        """Асинхронный генератор по ответам состоящим из нескольких блоков.
+
+        Аналогичен ISSClient.__iter__.
+        """
+        query = self._make_query()
+        start = 0
+        while True:
+            data = await self._get(query)
+            next_start = _next_start(data, start)
+            yield data
+            if next_start is None:
+                return
+            start = query["start"] = next_start
+
+    async def get(self, start: int | None = None) -> TablesDict:
+        """Загрузка данных.
+
+        :param start:
+            Номер элемента с которого нужно загрузить данные. Используется для дозагрузки данных, состоящих из
+            нескольких блоков. При отсутствии данные загружаются с начального элемента.
+        :return:
+            Блок данных с отброшенной вспомогательной информацией - словарь, каждый ключ которого
+            соответствует одной из таблиц с данными. Таблицы являются списками словарей, которые напрямую конвертируются
+            в pandas.DataFrame.
+        """
+        return await self._get(self._make_query(start))
+
+    async def _get(self, query: WebQuery) -> TablesDict:
+        """Асинхронная загрузка блока данных с заданными параметрами запроса."""
+        if bucket := ratelimit.get_bucket(self._url):
+            await bucket.acquire_async()
+        async with _get_semaphore():
+            if isinstance(self._session, AsyncTransport):
+                url, raw = await self._session.afetch(self._url, query)
+            else:
+                url, raw = await _fetch_async(self._session, self._url, query)
+        _, data, *wrong_data = raw
+        if len(wrong_data) != 0:
+            raise ISSMoexError("Ответ содержит некорректные данные", url)
+        return data
+
+    def _make_query(self, start: int | None = None) -> WebQuery:
+        """К общему набору параметров запроса добавляется требование предоставить ответ в виде расширенного json.
+
+        Общий набор параметров не изменяется, а для каждого вызова создается новый словарь, поэтому клиент может
+        одновременно использоваться для загрузки нескольких блоков данных. При последовательной загрузке всех блоков
+        один словарь используется для всех запросов.
+        """
+        if start:
+            return {**self._page_query, "start": start}
+
+        return {**self._page_query}
+
+    async def get_all(self) -> TablesDict:
+        """Собирает все блоки данных для запросов, ответы на которые выдаются по частям отдельными блоками.
+
+        :return:
+            Объединенные из всех блоков данные с отброшенной вспомогательной информацией - словарь, каждый ключ которого
+            соответствует одной из таблиц с данными. Таблицы являются списками словарей, которые напрямую конвертируются
+            в pandas.DataFrame.
+        """
+        all_data: TablesDict = {}
+        async for data in self:
+            for key, value in data.items():
+                all_data.setdefault(key, []).extend(value)
+
+        return all_data
@@ -0,0 +1,111 @@
+"""Загрузка метрик AlgoPack в виде pandas.DataFrame.
+
+Метрики tradestats и orderstats содержат десятки числовых столбцов. Функции модуля формируют DataFrame из списка
+словарей и приводят столбцы к заранее известным типам: дату торгов - к datetime64, цены и стоимости - к float64.
+Для работы необходимо установить дополнительные зависимости:
+
+    $ pip install apimoex[pandas]
+"""
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd  # pyright: ignore[reportMissingTypeStubs]
+
+from apimoex import client
+from apimoex import requests as moex_requests
+
+# noinspection PyProtectedMember
+from apimoex.requests import _ORDERSTATS_COLS, _TRADESTATS_COLS  # pyright: ignore[reportPrivateUsage]
+
+__all__ = [
+    "get_tradestats_df",
+    "get_orderstats_df",
+]
+
+_DATE_DTYPE = "datetime64[ns]"
+_FLOAT_DTYPE = "float64"
+_COUNT_PREFIXES = ("vol", "trades", "orders")
+_FLOAT_PREFIXES = ("pr_", "sec_pr_", "val", "vwap", "disb")
+
+
+def _dtype(column: str, inferred_kind: str) -> str | None:
+    """Тип данных, к которому нужно привести столбец метрик, или None, если подходит тип, определенный pandas.
+
+    :param column:
+        Наименование столбца.
+    :param inferred_kind:
+        Вид типа данных, определенного pandas (numpy.dtype.kind).
+    """
+    if column == "tradedate":
+        return _DATE_DTYPE
+
+    name = column.removeprefix("put_").removeprefix("cancel_")
+    # Количества остаются целыми, если все значения целые, а при пропусках или дробных значениях - вещественными
+    if name.startswith(_COUNT_PREFIXES):
+        return None if inferred_kind in "iu" else _FLOAT_DTYPE
+    if name.startswith(_FLOAT_PREFIXES):
+        return _FLOAT_DTYPE
+
+    return None
+
+
+def _to_frame(table: client.Table, columns: tuple[str, ...] | None) -> pd.DataFrame:
+    """Формирует DataFrame из таблицы и приводит столбцы к известным типам.
+
+    :param table:
+        Таблица с данными.
+    :param columns:
+        Запрошенные столбцы - используются для пустой таблицы.
+
+    :return:
+        DataFrame с типизированными столбцами.
+    """
+    df = pd.DataFrame(table) if table else pd.DataFrame(columns=list(columns or ()))
+    inferred = cast(dict[str, np.dtype[Any]], df.dtypes.to_dict())  # pyright: ignore[reportUnknownMemberType]
+    dtypes = {column: dtype for column, kind in inferred.items() if (dtype := _dtype(column, kind.kind)) is not None}
+
+    return cast(pd.DataFrame, df.astype(dtypes))  # pyright: ignore[reportUnknownMemberType]
+
+
+def get_tradestats_df(
+    session: client.Session,
+    security: str,
+    start: str | None = None,
+    end: str | None = None,
+    columns: tuple[str, ...] | None = _TRADESTATS_COLS,
+    *,
+    cache: bool = True,
+) -> pd.DataFrame:
+    """Метрики рассчитанные на основе потока сделок (tradestats) в виде DataFrame. Требуется авторизация ISS MOEX.
+
+    Параметры аналогичны apimoex.get_tradestats(). Дата торгов преобразуется в datetime64, цены и стоимости - в
+    float64, количества - в int64 или в float64 при наличии пропусков.
+
+    :return:
+        DataFrame с метриками.
+    """
+    table = moex_requests.get_tradestats(session, security, start, end, columns, cache=cache)
+
+    return _to_frame(table, columns)
+
+
+def get_orderstats_df(
+    session: client.Session,
+    security: str,
+    start: str | None = None,
+    end: str | None = None,
+    columns: tuple[str, ...] | None = _ORDERSTATS_COLS,
+    *,
+    cache: bool = True,
+) -> pd.DataFrame:
+    """Метрики рассчитанные на основе потока заявок (orderstats) в виде DataFrame. Требуется авторизация ISS MOEX.
+
+    Параметры аналогичны apimoex.get_orderstats(). Дата торгов преобразуется в datetime64, цены и стоимости - в
+    float64, количества - в int64 или в float64 при наличии пропусков.
+
+    :return:
+        DataFrame с метриками.
+    """
+    table = moex_requests.get_orderstats(session, security, start, end, columns, cache=cache)
+
+    return _to_frame(table, columns)
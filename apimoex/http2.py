@@ -0,0 +1,136 @@
+"""Транспорт для запросов к MOEX ISS по протоколу HTTP/2 на основе httpx.
+
+В отличие от HTTP/1.1 протокол HTTP/2 позволяет осуществлять несколько одновременных запросов через одно соединение,
+поэтому при одновременной загрузке данных для многих инструментов устанавливается лишь одно TLS соединение. Для работы
+необходимо установить дополнительные зависимости:
+
+    $ pip install apimoex[http2]
+
+Сессии можно передавать во все функции-запросы вместо requests.Session, а асинхронные сессии - во все функции из
+apimoex.aio вместо aiohttp.ClientSession.
+"""
+import types
+from typing import Any
+
+import httpx
+
+from apimoex import client
+
+__all__ = [
+    "HTTP2Session",
+    "AsyncHTTP2Session",
+    "make_http2_session",
+    "make_async_http2_session",
+]
+
+# Максимальное количество соединений - все запросы к одному хосту мультиплексируются в одном соединении
+MAX_CONNECTIONS = 2
+
+
+def _make_limits() -> httpx.Limits:
+    """Ограничения на количество соединений."""
+    return httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS)
+
+
+def _parse(respond: httpx.Response) -> tuple[str, list[Any]]:
+    """Проверяет статус ответа и разбирает json."""
+    try:
+        respond.raise_for_status()
+    except httpx.HTTPStatusError as err:
+        raise client.ISSMoexError("Неверный url", str(respond.url)) from err
+
+    return str(respond.url), respond.json()
+
+
+class HTTP2Session(client.Transport):
+    """Сессия для запросов к MOEX ISS по протоколу HTTP/2."""
+
+    def __init__(self, http_client: httpx.Client | None = None) -> None:
+        """Сессия закрывает переданный ей клиент при завершении работы.
+
+        :param http_client:
+            Клиент httpx. По умолчанию создается клиент с поддержкой HTTP/2.
+        """
+        self._client = http_client or httpx.Client(http2=True, limits=_make_limits())
+
+    def __enter__(self) -> "HTTP2Session":
+        """Сессия может использоваться в качестве менеджера контекста."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        """Закрывает соединения при выходе из контекста."""
+        self.close()
+
+    def fetch(self, url: str, params: client.WebQuery) -> tuple[str, list[Any]]:
+        """Загружает ответ и разбирает json."""
+        return _parse(self._client.get(url, params=params))
+
+    def close(self) -> None:
+        """Закрывает соединения."""
+        self._client.close()
+
+
+class AsyncHTTP2Session(client.AsyncTransport):
+    """Асинхронная сессия для запросов к MOEX ISS по протоколу HTTP/2."""
+
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        """Сессия закрывает переданный ей клиент при завершении работы.
+
+        :param http_client:
+            Асинхронный клиент httpx. По умолчанию создается клиент с поддержкой HTTP/2.
+        """
+        self._client = http_client or httpx.AsyncClient(http2=True, limits=_make_limits())
+
+    async def __aenter__(self) -> "AsyncHTTP2Session":
+        """Сессия может использоваться в качестве асинхронного менеджера контекста."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> None:
+        """Закрывает соединения при выходе из контекста."""
+        await self.aclose()
+
+    async def afetch(self, url: str, params: client.WebQuery) -> tuple[str, list[Any]]:
+        """Асинхронно загружает ответ и разбирает json."""
+        return _parse(await self._client.get(url, params=params))
+
+    async def aclose(self) -> None:
+        """Закрывает соединения."""
+        await self._client.aclose()
+
+
+def make_http2_session() -> HTTP2Session:
+    """Создать сессию для запросов к MOEX ISS по протоколу HTTP/2.
+
+    Сессию рекомендуется создавать один раз и использовать для всех запросов:
+
+        with http2.make_http2_session() as session:
+            data = apimoex.get_board_history(session, "SNGSP")
+
+    :return:
+        Сессия интернет соединения.
+    """
+    return HTTP2Session()
+
+
+def make_async_http2_session() -> AsyncHTTP2Session:
+    """Создать асинхронную сессию для запросов к MOEX ISS по протоколу HTTP/2.
+
+    Сессия может использоваться со всеми функциями из apimoex.aio:
+
+        async with http2.make_async_http2_session() as session:
+            data = await asyncio.gather(*(aio.get_board_history(session, ticker) for ticker in tickers))
+
+    :return:
+        Асинхронная сессия интернет соединения.
+    """
+    return AsyncHTTP2Session()
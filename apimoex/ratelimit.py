@@ -0,0 +1,110 @@
+"""Ограничение частоты запросов к MOEX ISS.
+
+При загрузке многих блоков данных и одновременных запросах для нескольких инструментов легко превысить ограничения
+MOEX на количество запросов с одного адреса. Все запросы ISSClient и AsyncISSClient проходят через общий для всех
+потоков и циклов событий ограничитель, отдельный для каждого хоста, поэтому частота запросов не превышает заданную.
+По умолчанию ограничитель включен и настраивается с помощью configure_rate_limit().
+"""
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+# Средняя допустимая частота запросов к одному хосту в секунду
+DEFAULT_RATE = 8.0
+# Количество запросов, которые могут быть отправлены подряд без ожидания
+DEFAULT_BURST = 16
+
+
+class TokenBucket:
+    """Ограничитель частоты запросов по алгоритму маркерной корзины.
+
+    Корзина пополняется с постоянной частотой, но вмещает не более burst маркеров. Каждый запрос забирает один маркер,
+    а при их отсутствии ожидает пополнения корзины. Ожидание резервируется под блокировкой, а сам сон происходит вне ее,
+    поэтому ограничитель может одновременно использоваться из нескольких потоков и циклов событий.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST) -> None:
+        """Изначально корзина заполнена.
+
+        :param rate:
+            Средняя допустимая частота запросов в секунду.
+        :param burst:
+            Количество запросов, которые могут быть отправлены подряд без ожидания.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Некорректные параметры ограничителя rate={rate}, burst={burst}")
+
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Наименование класса и параметры ограничителя."""
+        return f"{self.__class__.__name__}(rate={self._rate}, burst={self._burst})"
+
+    def reserve(self) -> float:
+        """Забрать маркер из корзины.
+
+        :return:
+            Время в секундах, которое необходимо подождать перед отправкой запроса.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+
+            return max(0.0, -self._tokens / self._rate)
+
+    def acquire(self) -> None:
+        """Дождаться возможности отправить запрос."""
+        if delay := self.reserve():
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Асинхронно дождаться возможности отправить запрос."""
+        if delay := self.reserve():
+            await asyncio.sleep(delay)
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+_rate: float | None = DEFAULT_RATE
+_burst = DEFAULT_BURST
+
+
+def configure_rate_limit(*, enabled: bool = True, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST) -> None:
+    """Включить или выключить ограничение частоты запросов к MOEX ISS.
+
+    :param enabled:
+        Включить ограничение.
+    :param rate:
+        Средняя допустимая частота запросов к одному хосту в секунду.
+    :param burst:
+        Количество запросов к одному хосту, которые могут быть отправлены подряд без ожидания.
+    """
+    global _rate, _burst  # noqa: PLW0603
+
+    if enabled and (rate <= 0 or burst < 1):
+        raise ValueError(f"Некорректные параметры ограничителя rate={rate}, burst={burst}")
+
+    with _buckets_lock:
+        _rate = rate if enabled else None
+        _burst = burst
+        _buckets.clear()
+
+
+def get_bucket(url: str) -> TokenBucket | None:
+    """Ограничитель для хоста, к которому относится адрес запроса, или None, если ограничение выключено."""
+    host = urlsplit(url).netloc
+    with _buckets_lock:
+        if _rate is None:
+            return None
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = TokenBucket(_rate, _burst)
+
+        return bucket
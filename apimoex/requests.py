@@ -5,10 +5,13 @@
     Дополнительное описание https://fs.moex.com/files/6523
 """
 
+import base64
+from http import HTTPStatus
+
 import requests
-from requests.auth import HTTPBasicAuth
 
-from apimoex import client
+from apimoex import cache as disk_cache
+from apimoex import client, ratelimit
 
 __all__ = [
     "get_reference",
@@ -29,6 +32,104 @@ __all__ = [
     "get_orderstats"
 ]
 
+_ISS_URL = "https://iss.moex.com/iss"
+_PASSPORT_URL = "https://passport.moex.com/authenticate"
+
+_SECURITIES_COLS = ("secid", "regnumber")
+_DESCRIPTION_COLS = ("name", "title", "value")
+_BOARD_SECURITIES_COLS = ("SECID", "REGNUMBER", "LOTSIZE", "SHORTNAME")
+_CANDLE_COLS = ("begin", "open", "close", "high", "low", "value", "volume")
+_HISTORY_COLS = ("BOARDID", "TRADEDATE", "CLOSE", "VOLUME", "VALUE")
+_INDEX_TICKERS_COLS = ("ticker", "from", "till", "tradingsession")
+_TRADES_COLS = (
+    "TRADENO",
+    "TRADETIME",
+    "BOARDID",
+    "SECID",
+    "PRICE",
+    "QUANTITY",
+    "VALUE",
+    "PERIOD",
+    "TRADETIME_GRP",
+    "SYSTIME",
+    "BUYSELL",
+    "DECIMALS",
+    "TRADINGSESSION",
+)
+_TRADESTATS_COLS = (
+    "tradedate",
+    "tradetime",
+    "secid",
+    "pr_open",
+    "pr_high",
+    "pr_low",
+    "pr_close",
+    "pr_std",
+    "vol",
+    "val",
+    "trades",
+    "pr_vwap",
+    "pr_change",
+    "trades_b",
+    "trades_s",
+    "val_b",
+    "val_s",
+    "vol_b",
+    "vol_s",
+    "disb",
+    "pr_vwap_b",
+    "pr_vwap_s",
+    "SYSTIME",
+    "sec_pr_open",
+    "sec_pr_high",
+    "sec_pr_low",
+    "sec_pr_close",
+)
+_ORDERSTATS_COLS = (
+    "tradedate",
+    "tradetime",
+    "secid",
+    "put_orders_b",
+    "put_orders_s",
+    "put_val_b",
+    "put_val_s",
+    "put_vol_b",
+    "put_vol_s",
+    "put_vwap_b",
+    "put_vwap_s",
+    "put_vol",
+    "put_val",
+    "put_orders",
+    "cancel_orders_b",
+    "cancel_orders_s",
+    "cancel_val_b",
+    "cancel_val_s",
+    "cancel_vol_b",
+    "cancel_vol_s",
+    "cancel_vwap_b",
+    "cancel_vwap_s",
+    "cancel_vol",
+    "cancel_val",
+    "cancel_orders",
+    "SYSTIME",
+)
+
+# Заранее сформированные строки для кортежей столбцов по умолчанию - ключом является id кортежа
+_DEFAULT_COLS_STR = {
+    id(columns): ",".join(columns)
+    for columns in (
+        _SECURITIES_COLS,
+        _DESCRIPTION_COLS,
+        _BOARD_SECURITIES_COLS,
+        _CANDLE_COLS,
+        _HISTORY_COLS,
+        _INDEX_TICKERS_COLS,
+        _TRADES_COLS,
+        _TRADESTATS_COLS,
+        _ORDERSTATS_COLS,
+    )
+}
+
 
 def _make_query(
     *,
@@ -37,12 +138,14 @@ def _make_query(
     start: str | None = None,
     end: str | None = None,
     date: str | None = None,
+    tradeno: str | None = None,
     table: str | None = None,
     columns: tuple[str, ...] | None = None,
 ) -> client.WebQuery:
     """Формирует дополнительные параметры запроса к MOEX ISS.
 
-    В случае None значений не добавляются в запрос.
+    В случае None значений не добавляются в запрос. Требование предоставить ответ в виде расширенного json без
+    метаданных (iss.json=extended и iss.meta=off) добавляется ко всем запросам клиентом, поэтому здесь не дублируется.
 
     :param q:
         Строка с частью характеристик бумаги для поиска.
@@ -54,6 +157,8 @@ def _make_query(
         Конечная дата котировок.
     :param date:
         Точная дата (используется при получении тикеров в индексе).
+    :param tradeno:
+        Номер сделки, начиная с которой нужно загрузить сделки.
     :param table:
         Таблица, которую нужно загрузить (для запросов, предполагающих наличие нескольких таблиц).
     :param columns:
@@ -73,14 +178,26 @@ def _make_query(
         query["till"] = end
     if date:
         query["date"] = date
+    if tradeno:
+        query["tradeno"] = tradeno
     if table:
         query["iss.only"] = f"{table},history.cursor"
     if columns:
-        query[f"{table}.columns"] = ",".join(columns)
+        query[f"{table}.columns"] = _DEFAULT_COLS_STR.get(id(columns)) or ",".join(columns)
 
     return query
 
 
+def _basic_auth_header(username: str, password: str) -> dict[str, str]:
+    """Заголовок basic-аутентификации.
+
+    Заголовок не сохраняется в сессии, чтобы учетные данные не передавались в запросах к другим хостам.
+    """
+    token = base64.b64encode(f"{username}:{password}".encode()).decode()
+
+    return {"Authorization": f"Basic {token}"}
+
+
 def _get_table(data: client.TablesDict, table: str) -> client.Table:
     """Извлекает конкретную таблицу из данных."""
     try:
@@ -90,10 +207,12 @@ def _get_table(data: client.TablesDict, table: str) -> client.Table:
 
 
 def _get_short_data(
-    session: requests.Session,
+    session: client.Session,
     url: str,
     table: str,
     query: client.WebQuery | None = None,
+    *,
+    use_cache: bool = True,
 ) -> client.Table:
     """Получить данные для запроса с выдачей всей информации за раз.
 
@@ -105,21 +224,34 @@ def _get_short_data(
         Таблица, которую нужно выбрать.
     :param query:
         Дополнительные параметры запроса.
+    :param use_cache:
+        Использовать дисковый кэш, если он включен.
 
     :return:
         Конкретная таблица из запроса.
     """
-    iss = client.ISSClient(session, url, query)
-    data = iss.get()
+    query = query or {}
+    file_cache = disk_cache.get_cache() if use_cache else None
+    if file_cache is None:
+        iss = client.ISSClient(session, url, query)
+        return _get_table(iss.get(), table)
+
+    rows, missing_query = file_cache.lookup(url, query)
+    if missing_query is not None:
+        iss = client.ISSClient(session, url, missing_query)
+        rows = _get_table(iss.get(), table)
+        file_cache.store(url, query, rows)
 
-    return _get_table(data, table)
+    return rows
 
 
 def _get_long_data(
-    session: requests.Session,
+    session: client.Session,
     url: str,
     table: str,
     query: client.WebQuery | None = None,
+    *,
+    use_cache: bool = True,
 ) -> client.Table:
     """Получить данные для запроса, в котором информация выдается несколькими блоками.
 
@@ -131,17 +263,34 @@ def _get_long_data(
         Таблица, которую нужно выбрать.
     :param query:
         Дополнительные параметры запроса.
+    :param use_cache:
+        Использовать дисковый кэш, если он включен.
 
     :return:
         Конкретная таблица из запроса.
     """
-    iss = client.ISSClient(session, url, query)
-    data = iss.get_all()
+    query = query or {}
+    file_cache = disk_cache.get_cache() if use_cache else None
+    if file_cache is None:
+        iss = client.ISSClient(session, url, query)
+        return _get_table(iss.get_all(), table)
+
+    date_column = disk_cache.DATE_COLUMNS.get(table)
+    rows, missing_query = file_cache.lookup(url, query, date_column)
+    if missing_query is not None:
+        iss = client.ISSClient(session, url, missing_query)
+        rows.extend(_get_table(iss.get_all(), table))
+        file_cache.store(url, query, rows, date_column)
 
-    return _get_table(data, table)
+    return rows
 
 
-def get_reference(session: requests.Session, placeholder: str = "boards") -> list[dict[str, str | int | float]]:
+def get_reference(
+    session: client.Session,
+    placeholder: str = "boards",
+    *,
+    cache: bool = True,
+) -> list[dict[str, str | int | float]]:
     """Получить перечень доступных значений плейсхолдера в адресе запроса.
 
     Например в описание запроса https://iss.moex.com/iss/reference/32 присутствует следующий адрес
@@ -150,23 +299,28 @@ def get_reference(session: requests.Session, placeholder: str = "boards") -> lis
     Описание запроса - https://iss.moex.com/iss/reference/28
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param placeholder:
         Наименование плейсхолдера в адресе запроса: engines, markets, boards, boardgroups, durations, securitytypes,
         securitygroups, securitycollections
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = "https://iss.moex.com/iss/index.json"
+    url = f"{_ISS_URL}/index.json"
 
-    return _get_short_data(session, url, placeholder)
+    return _get_short_data(session, url, placeholder, use_cache=cache)
 
 
 def find_securities(
-    session: requests.Session,
+    session: client.Session,
     string: str,
-    columns: tuple[str, ...] | None = ("secid", "regnumber"),
+    columns: tuple[str, ...] | None = _SECURITIES_COLS,
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Найти инструменты по части Кода, Названию, ISIN, Идентификатору Эмитента, Номеру гос.регистрации.
 
@@ -176,27 +330,32 @@ def find_securities(
     Описание запроса - https://iss.moex.com/iss/reference/5
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param string:
         Часть Кода, Названия, ISIN, Идентификатора Эмитента, Номера гос.регистрации.
     :param columns:
         Кортеж столбцов, которые нужно загрузить - по умолчанию тикер и номер государственно регистрации.
         Если пустой или None, то загружаются все столбцы.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = "https://iss.moex.com/iss/securities.json"
+    url = f"{_ISS_URL}/securities.json"
     table = "securities"
     query = _make_query(q=string, table=table, columns=columns)
 
-    return _get_short_data(session, url, table, query)
+    return _get_short_data(session, url, table, query, use_cache=cache)
 
 
 def find_security_description(
-    session: requests.Session,
+    session: client.Session,
     security: str,
-    columns: tuple[str, ...] | None = ("name", "title", "value"),
+    columns: tuple[str, ...] | None = _DESCRIPTION_COLS,
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Получить спецификацию инструмента.
 
@@ -205,64 +364,75 @@ def find_security_description(
     Описание запроса - https://iss.moex.com/iss/reference/13
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param security:
         Тикер ценной бумаги.
     :param columns:
         Кортеж столбцов, которые нужно загрузить - по умолчанию краткое название, длинное название на русском и значение
         показателя.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = f"https://iss.moex.com/iss/securities/{security}.json"
+    url = f"{_ISS_URL}/securities/{security}.json"
     table = "description"
     query = _make_query(table=table, columns=columns)
 
-    return _get_short_data(session, url, table, query)
+    return _get_short_data(session, url, table, query, use_cache=cache)
 
 
 def get_market_candle_borders(
-    session: requests.Session,
+    session: client.Session,
     security: str,
     market: str = "shares",
     engine: str = "stock",
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Получить таблицу интервалов доступных дат для свечей различного размера на рынке для всех режимов торгов.
 
     Описание запроса - https://iss.moex.com/iss/reference/156
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param security:
         Тикер ценной бумаги.
     :param market:
         Рынок - по умолчанию акции.
     :param engine:
         Движок - по умолчанию акции.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = f"https://iss.moex.com/iss/engines/{engine}/markets/{market}/securities/{security}/candleborders.json"
+    url = f"{_ISS_URL}/engines/{engine}/markets/{market}/securities/{security}/candleborders.json"
     table = "borders"
 
-    return _get_short_data(session, url, table)
+    return _get_short_data(session, url, table, use_cache=cache)
 
 
 def get_board_candle_borders(
-    session: requests.Session,
+    session: client.Session,
     security: str,
     board: str = "TQBR",
     market: str = "shares",
     engine: str = "stock",
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Получить таблицу интервалов доступных дат для свечей различного размера в указанном режиме торгов.
 
     Описание запроса - https://iss.moex.com/iss/reference/48
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param security:
         Тикер ценной бумаги.
     :param board:
@@ -271,36 +441,29 @@ def get_board_candle_borders(
         Рынок - по умолчанию акции.
     :param engine:
         Движок - по умолчанию акции.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = (
-        f"https://iss.moex.com/iss/engines/{engine}/markets/{market}/"
-        f"boards/{board}/securities/{security}/candleborders.json"
-    )
+    url = f"{_ISS_URL}/engines/{engine}/markets/{market}/boards/{board}/securities/{security}/candleborders.json"
     table = "borders"
 
-    return _get_short_data(session, url, table)
+    return _get_short_data(session, url, table, use_cache=cache)
 
 
 def get_market_candles(
-    session: requests.Session,
+    session: client.Session,
     security: str,
     interval: int = 24,
     start: str | None = None,
     end: str | None = None,
-    columns: tuple[str, ...] | None = (
-        "begin",
-        "open",
-        "close",
-        "high",
-        "low",
-        "value",
-        "volume",
-    ),
+    columns: tuple[str, ...] | None = _CANDLE_COLS,
     market: str = "shares",
     engine: str = "stock",
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Получить свечи в формате HLOCV указанного инструмента на рынке для основного режима торгов за интервал дат.
 
@@ -311,7 +474,8 @@ def get_market_candles(
     Описание запроса - https://iss.moex.com/iss/reference/155
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param security:
         Тикер ценной бумаги.
     :param interval:
@@ -329,42 +493,39 @@ def get_market_candles(
         Рынок - по умолчанию акции.
     :param engine:
         Движок - по умолчанию акции.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = f"https://iss.moex.com/iss/engines/{engine}/markets/{market}/securities/{security}/candles.json"
+    url = f"{_ISS_URL}/engines/{engine}/markets/{market}/securities/{security}/candles.json"
     table = "candles"
     query = _make_query(interval=interval, start=start, end=end, table=table, columns=columns)
 
-    return _get_long_data(session, url, table, query)
+    return _get_long_data(session, url, table, query, use_cache=cache)
 
 
 def get_board_candles(
-    session: requests.Session,
+    session: client.Session,
     security: str,
     interval: int = 24,
     start: str | None = None,
     end: str | None = None,
-    columns: tuple[str, ...] | None = (
-        "begin",
-        "open",
-        "close",
-        "high",
-        "low",
-        "value",
-        "volume",
-    ),
+    columns: tuple[str, ...] | None = _CANDLE_COLS,
     board: str = "TQBR",
     market: str = "shares",
     engine: str = "stock",
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Получить свечи в формате HLOCV указанного инструмента в указанном режиме торгов за интервал дат.
 
     Описание запроса - https://iss.moex.com/iss/reference/46
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param security:
         Тикер ценной бумаги.
     :param interval:
@@ -384,62 +545,69 @@ def get_board_candles(
         Рынок - по умолчанию акции.
     :param engine:
         Движок - по умолчанию акции.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = (
-        f"https://iss.moex.com/iss/engines/{engine}/markets/{market}/"
-        f"boards/{board}/securities/{security}/candles.json"
-    )
+    url = f"{_ISS_URL}/engines/{engine}/markets/{market}/boards/{board}/securities/{security}/candles.json"
     table = "candles"
     query = _make_query(interval=interval, start=start, end=end, table=table, columns=columns)
 
-    return _get_long_data(session, url, table, query)
+    return _get_long_data(session, url, table, query, use_cache=cache)
 
 
 def get_board_dates(
-    session: requests.Session,
+    session: client.Session,
     board: str = "TQBR",
     market: str = "shares",
     engine: str = "stock",
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Получить интервал дат, доступных в истории для рынка по заданному режиму торгов.
 
     Описание запроса - https://iss.moex.com/iss/reference/26
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param board:
         Режим торгов - по умолчанию основной режим торгов T+2.
     :param market:
         Рынок - по умолчанию акции.
     :param engine:
         Движок - по умолчанию акции.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список из одного элемента - словаря с ключами 'from' и 'till'.
     """
-    url = f"https://iss.moex.com/iss/history/engines/{engine}/markets/{market}/boards/{board}/dates.json"
+    url = f"{_ISS_URL}/history/engines/{engine}/markets/{market}/boards/{board}/dates.json"
     table = "dates"
 
-    return _get_short_data(session, url, table)
+    return _get_short_data(session, url, table, use_cache=cache)
 
 
 def get_board_securities(
-    session: requests.Session,
+    session: client.Session,
     table: str = "securities",
-    columns: tuple[str, ...] | None = ("SECID", "REGNUMBER", "LOTSIZE", "SHORTNAME"),
+    columns: tuple[str, ...] | None = _BOARD_SECURITIES_COLS,
     board: str = "TQBR",
     market: str = "shares",
     engine: str = "stock",
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Получить таблицу инструментов по режиму торгов со вспомогательной информацией.
 
     Описание запроса - https://iss.moex.com/iss/reference/32
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param table:
         Таблица с данными, которую нужно вернуть: securities - справочник торгуемых ценных бумаг, marketdata -
         данные с результатами торгов текущего дня.
@@ -452,30 +620,28 @@ def get_board_securities(
         Рынок - по умолчанию акции.
     :param engine:
         Движок - по умолчанию акции.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = f"https://iss.moex.com/iss/engines/{engine}/markets/{market}/boards/{board}/securities.json"
+    url = f"{_ISS_URL}/engines/{engine}/markets/{market}/boards/{board}/securities.json"
     query = _make_query(table=table, columns=columns)
 
-    return _get_short_data(session, url, table, query)
+    return _get_short_data(session, url, table, query, use_cache=cache)
 
 
 def get_market_history(
-    session: requests.Session,
+    session: client.Session,
     security: str,
     start: str | None = None,
     end: str | None = None,
-    columns: tuple[str, ...] | None = (
-        "BOARDID",
-        "TRADEDATE",
-        "CLOSE",
-        "VOLUME",
-        "VALUE",
-    ),
+    columns: tuple[str, ...] | None = _HISTORY_COLS,
     market: str = "shares",
     engine: str = "stock",
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Получить историю по одной бумаге на рынке для всех режимов торгов за интервал дат.
 
@@ -484,7 +650,8 @@ def get_market_history(
     Описание запроса - https://iss.moex.com/iss/reference/63
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param security:
         Тикер ценной бумаги.
     :param start:
@@ -498,39 +665,38 @@ def get_market_history(
         Рынок - по умолчанию акции.
     :param engine:
         Движок - по умолчанию акции.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = f"https://iss.moex.com/iss/history/engines/{engine}/markets/{market}/securities/{security}.json"
+    url = f"{_ISS_URL}/history/engines/{engine}/markets/{market}/securities/{security}.json"
     table = "history"
     query = _make_query(start=start, end=end, table=table, columns=columns)
 
-    return _get_long_data(session, url, table, query)
+    return _get_long_data(session, url, table, query, use_cache=cache)
 
 
 def get_board_history(
-    session: requests.Session,
+    session: client.Session,
     security: str,
     start: str | None = None,
     end: str | None = None,
-    columns: tuple[str, ...] | None = (
-        "BOARDID",
-        "TRADEDATE",
-        "CLOSE",
-        "VOLUME",
-        "VALUE",
-    ),
+    columns: tuple[str, ...] | None = _HISTORY_COLS,
     board: str = "TQBR",
     market: str = "shares",
     engine: str = "stock",
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Получить историю торгов для указанной бумаги в указанном режиме торгов за указанный интервал дат.
 
     Описание запроса - https://iss.moex.com/iss/reference/65
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param security:
         Тикер ценной бумаги.
     :param start:
@@ -546,32 +712,28 @@ def get_board_history(
         Рынок - по умолчанию акции.
     :param engine:
         Движок - по умолчанию акции.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = (
-        f"https://iss.moex.com/iss/history/engines/{engine}/markets/{market}/"
-        f"boards/{board}/securities/{security}.json"
-    )
+    url = f"{_ISS_URL}/history/engines/{engine}/markets/{market}/boards/{board}/securities/{security}.json"
     table = "history"
     query = _make_query(start=start, end=end, table=table, columns=columns)
 
-    return _get_long_data(session, url, table, query)
+    return _get_long_data(session, url, table, query, use_cache=cache)
 
 
 def get_index_tickers(
-    session: requests.Session,
+    session: client.Session,
     index: str,
     date: str | None = None,
-    columns: tuple[str, ...] | None = (
-        "ticker",
-        "from",
-        "till",
-        "tradingsession",
-    ),
+    columns: tuple[str, ...] | None = _INDEX_TICKERS_COLS,
     market: str = "index",
     engine: str = "stock",
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Получить информацию по составу указанного индекса за указанную дату.
 
@@ -580,7 +742,8 @@ def get_index_tickers(
     Список индексов - https://iss.moex.com/iss/statistics/engines/stock/markets/index/analytics
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param index:
         Название индекса. Например, IMOEX.
     :param date:
@@ -594,45 +757,37 @@ def get_index_tickers(
         Рынок - по умолчанию индексы.
     :param engine:
         Движок - по умолчанию акции.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = f"https://iss.moex.com/iss/statistics/engines/{engine}/markets/{market}/" f"analytics/{index}/tickers.json"
+    url = f"{_ISS_URL}/statistics/engines/{engine}/markets/{market}/analytics/{index}/tickers.json"
     table = "tickers"
     query = _make_query(date=date, table=table, columns=columns)
 
-    return _get_short_data(session, url, table, query)
+    return _get_short_data(session, url, table, query, use_cache=cache)
 
 
 def get_board_today_trades(
-    session: requests.Session,
+    session: client.Session,
     security: str,
     tradeno: str = '',
-    columns: tuple[str, ...] | None = (
-            "TRADENO",
-            "TRADETIME",
-            "BOARDID",
-            "SECID",
-            "PRICE",
-            "QUANTITY",
-            "VALUE",
-            "PERIOD",
-            "TRADETIME_GRP",
-            "SYSTIME",
-            "BUYSELL",
-            "DECIMALS",
-            "TRADINGSESSION"),
+    columns: tuple[str, ...] | None = _TRADES_COLS,
     board: str = "TQBR",
     market: str = "shares",
     engine: str = "stock",
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Получить сделки указанного инструмента в указанном режиме торгов за сегодня.
 
     Описание запроса - https://iss.moex.com/iss/reference/55
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param security:
         Тикер ценной бумаги.
     :param columns:
@@ -644,88 +799,63 @@ def get_board_today_trades(
         Рынок - по умолчанию акции.
     :param engine:
         Движок - по умолчанию акции.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = (
-        f"https://iss.moex.com/iss/engines/{engine}/markets/{market}/"
-        f"boards/{board}/securities/{security}/trades.json"
-    )
+    url = f"{_ISS_URL}/engines/{engine}/markets/{market}/boards/{board}/securities/{security}/trades.json"
     table = "trades"
-    query = _make_query(table=table, columns=columns, )
-    if len(tradeno)>0:
-        query['tradeno'] = tradeno
+    query = _make_query(tradeno=tradeno, table=table, columns=columns)
 
-    return _get_long_data(session, url, table, query)
+    return _get_long_data(session, url, table, query, use_cache=cache)
 
 
 def authenticate(session: requests.Session, username: str, password: str) -> bool:
-    
-    """Для аутентификации пользователей используется basic-аутентификация. и передаются серверу в заголовке запроса на https://passport.moex.com/authenticate
-    При успешной аутентификации сервер возвращает cookie c именем MicexPassportCert. Далее этот токен должен передаваться при последующих запросах.
-    
+    """Аутентификация пользователя для доступа к данным, требующим авторизации ISS MOEX.
+
+    Для аутентификации используется basic-аутентификация - заголовок Authorization формируется один раз и передается
+    только в запросе к https://passport.moex.com/authenticate. При успешной аутентификации сервер возвращает cookie
+    MicexPassportCert, который сохраняется в переданной сессии и автоматически передается при последующих запросах.
+    После этого сессия готова для get_tradestats() и get_orderstats() без дополнительной настройки.
+
     Описание запроса - https://moexalgo.github.io/api/rest/
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param username:
-        iss moex username 
+        Имя пользователя ISS MOEX.
     :param password:
-        iss moex password
+        Пароль пользователя ISS MOEX.
 
     :return:
         True в случае успешной авторизации
     """
-    url = "https://passport.moex.com/authenticate"
-    r = False
+    if bucket := ratelimit.get_bucket(_PASSPORT_URL):
+        bucket.acquire()
+    respond = session.get(_PASSPORT_URL, headers=_basic_auth_header(username, password))
 
-    with session.get(url, auth = HTTPBasicAuth(username, password)) as respond:
-        r = respond.status_code == 200
-        
-    return r
+    return respond.status_code == HTTPStatus.OK
 
 
 def get_tradestats(
-    session: requests.Session,
+    session: client.Session,
     security: str,
     start: str | None = None,
     end: str | None = None,
-    columns: tuple[str, ...] | None = (
-            "tradedate",
-            "tradetime",
-            "secid",
-            "pr_open",
-            "pr_high",
-            "pr_low",
-            "pr_close",
-            "pr_std",
-            "vol",
-            "val",
-            "trades",
-            "pr_vwap",
-            "pr_change",
-            "trades_b",
-            "trades_s",
-            "val_b",
-            "val_s",
-            "vol_b",
-            "vol_s",
-            "disb",
-            "pr_vwap_b",
-            "pr_vwap_s",
-            "SYSTIME",
-            "sec_pr_open",
-            "sec_pr_high",
-            "sec_pr_low",
-            "sec_pr_close"),
+    columns: tuple[str, ...] | None = _TRADESTATS_COLS,
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Метрики рассчитанные на основе потока сделок (tradestats). Требуется авторизация ISS MOEX
 
     Описание запроса - https://moexalgo.github.io/api/rest/
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param security:
         Тикер ценной бумаги.
     :param columns:
@@ -735,57 +865,34 @@ def get_tradestats(
         Дата вида ГГГГ-ММ-ДД. При отсутствии данные будут загружены с начала истории.
     :param end:
         Дата вида ГГГГ-ММ-ДД. При отсутствии данные будут загружены до конца истории.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = (
-        f"https://iss.moex.com/iss/datashop/algopack/eq/tradestats/{security}.json"
-    )
+    url = f"{_ISS_URL}/datashop/algopack/eq/tradestats/{security}.json"
     table = "data"
     query = _make_query(start=start, end=end, table=table, columns=columns)
 
-    return _get_long_data(session, url, table, query)
+    return _get_long_data(session, url, table, query, use_cache=cache)
 
 def get_orderstats(
-    session: requests.Session,
+    session: client.Session,
     security: str,
     start: str | None = None,
     end: str | None = None,
-    columns: tuple[str, ...] | None = (
-            "tradedate",
-            "tradetime",
-            "secid",
-            "put_orders_b",
-            "put_orders_s",
-            "put_val_b",
-            "put_val_s",
-            "put_vol_b",
-            "put_vol_s",
-            "put_vwap_b",
-            "put_vwap_s",
-            "put_vol",
-            "put_val",
-            "put_orders",
-            "cancel_orders_b",
-            "cancel_orders_s",
-            "cancel_val_b",
-            "cancel_val_s",
-            "cancel_vol_b",
-            "cancel_vol_s",
-            "cancel_vwap_b",
-            "cancel_vwap_s",
-            "cancel_vol",
-            "cancel_val",
-            "cancel_orders",
-            "SYSTIME"),
+    columns: tuple[str, ...] | None = _ORDERSTATS_COLS,
+    *,
+    cache: bool = True,
 ) -> client.Table:
     """Метрики рассчитанные на основе потока заявок (orderstats). Требуется авторизация ISS MOEX
 
     Описание запроса - https://moexalgo.github.io/api/rest/
 
     :param session:
-        Сессия интернет соединения.
+        Сессия интернет соединения. Рекомендуется создать одну сессию с помощью apimoex.make_session() и
+        использовать ее для всех запросов.
     :param security:
         Тикер ценной бумаги.
     :param columns:
@@ -795,14 +902,14 @@ def get_orderstats(
         Дата вида ГГГГ-ММ-ДД. При отсутствии данные будут загружены с начала истории.
     :param end:
         Дата вида ГГГГ-ММ-ДД. При отсутствии данные будут загружены до конца истории.
+    :param cache:
+        Использовать дисковый кэш, если он включен с помощью apimoex.configure_cache().
 
     :return:
         Список словарей, которые напрямую конвертируется в pandas.DataFrame.
     """
-    url = (
-        f"https://iss.moex.com/iss/datashop/algopack/eq/orderstats/{security}.json"
-    )
+    url = f"{_ISS_URL}/datashop/algopack/eq/orderstats/{security}.json"
     table = "data"
     query = _make_query(start=start, end=end, table=table, columns=columns)
 
-    return _get_long_data(session, url, table, query)
+    return _get_long_data(session, url, table, query, use_cache=cache)
@@ -0,0 +1,43 @@
+"""Создание http сессии для запросов к MOEX ISS."""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+
+# Количество хостов MOEX, для которых сохраняются пулы соединений - iss.moex.com, passport.moex.com и т.д.
+POOL_CONNECTIONS = 4
+# Максимальное количество сохраняемых соединений с одним хостом
+POOL_MAXSIZE = 32
+
+
+def make_session() -> requests.Session:
+    """Создать сессию с пулом постоянных соединений для запросов к MOEX ISS.
+
+    Повторные запросы в рамках одной сессии используют уже установленные TCP и TLS соединения, что избавляет от
+    затрат на их установку при каждом запросе. Запросы, завершившиеся временными ошибками сервера или превышением
+    ограничения на частоту запросов, повторяются с учетом заголовка Retry-After.
+
+    Сессия запрашивает сжатие ответов всеми алгоритмами, которые поддерживает urllib3 - gzip и deflate, а при
+    установленном brotli (apimoex[brotli]) также br. Сжатые ответы распаковываются по мере загрузки, в том числе при
+    потоковом разборе с помощью ijson.
+
+    Сессию рекомендуется создавать один раз и использовать для всех запросов:
+
+        with apimoex.make_session() as session:
+            data = apimoex.get_board_history(session, "SNGSP")
+
+    :return:
+        Сессия интернет соединения.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 502, 503, 504),
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers.update(make_headers(accept_encoding=True))
+
+    return session
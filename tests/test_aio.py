@@ -0,0 +1,90 @@
+"""Тесты для асинхронных запросов."""
+import asyncio
+import typing
+
+import aiohttp
+import pytest
+
+from apimoex import aio, client
+
+
+def run(coroutine_function, *args, **kwargs):
+    """Выполнение асинхронного запроса в отдельной сессии."""
+
+    async def main():
+        async with aiohttp.ClientSession() as session:
+            return await coroutine_function(session, *args, **kwargs)
+
+    return asyncio.run(main())
+
+
+def test_async_iss_client_async_iterable():
+    assert issubclass(client.AsyncISSClient, typing.AsyncIterable)
+
+
+def test_get_reference():
+    data = run(aio.get_reference, "engines")
+    assert isinstance(data, list)
+    assert len(data) == 11
+    assert data[0] == {"id": 1, "name": "stock", "title": "Фондовый рынок и рынок депозитов"}
+
+
+def test_get_wrong_url():
+    with pytest.raises(client.ISSMoexError) as error:
+        # noinspection PyProtectedMember
+        run(aio._get_short_data, "https://iss.moex.com/iss/securities1.json", "securities")
+    assert "Неверный url" in str(error.value)
+
+
+def test_get_board_history_from_beginning():
+    data = run(aio.get_board_history, "LSNGP", end="2014-08-01")
+    assert data[0]["TRADEDATE"] == "2014-06-09"
+    assert data[0]["CLOSE"] == pytest.approx(14.7)
+    assert len(data[0]) == 5
+
+
+def test_get_market_candles_from_beginning():
+    data = run(aio.get_market_candles, "RTKM", interval=1, end="2011-12-16")
+    assert len(data) > 500
+    assert data[0]["open"] == pytest.approx(141.55)
+    assert data[6]["begin"] == "2011-12-15 10:06:00"
+
+
+def test_gather():
+    async def main():
+        async with aiohttp.ClientSession() as session:
+            return await asyncio.gather(
+                aio.get_board_history(session, "LSNGP", end="2014-08-01"),
+                aio.get_board_history(session, "LSNGP", end="2014-08-01"),
+            )
+
+    first, second = asyncio.run(main())
+    assert first == second
+    assert len(first) > 30
+
+
+def test_concurrent_get_start():
+    class FakeTransport:
+        async def afetch(self, url, params):
+            await asyncio.sleep(0)
+            return url, [{}, {"data": [{"start": params.get("start", 0)}]}]
+
+    async def main():
+        iss = client.AsyncISSClient(FakeTransport(), "test_url")
+        return await asyncio.gather(iss.get(0), iss.get(100), iss.get(200))
+
+    data = asyncio.run(main())
+    assert [block["data"][0]["start"] for block in data] == [0, 100, 200]
+
+
+def test_get_all_pages():
+    class FakeTransport:
+        async def afetch(self, url, params):
+            start = params.get("start", 0)
+            return url, [{}, {"data": [{"start": start}] * (100 if start < 200 else 0)}]
+
+    async def main():
+        return await client.AsyncISSClient(FakeTransport(), "test_url").get_all()
+
+    data = asyncio.run(main())["data"]
+    assert [row["start"] for row in data[::100]] == [0, 100]
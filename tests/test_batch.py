@@ -0,0 +1,35 @@
+"""Тесты для одновременной загрузки данных для нескольких инструментов."""
+import pytest
+import requests
+
+from apimoex import batch, client
+from apimoex import requests as moex_requests
+from apimoex import session as moex_session
+
+
+@pytest.fixture(scope="module", name="session")
+def make_session():
+    with moex_session.make_session() as session:
+        yield session
+
+
+def test_small_pool():
+    with requests.Session() as session:
+        with pytest.raises(client.ISSMoexError) as error:
+            batch.get_many_board_history(session, ["LSNGP"], max_workers=16)
+    assert "Размер пула соединений 10 меньше количества потоков 16" in str(error.value)
+    assert "используйте apimoex.make_session()" in str(error.value)
+
+
+def test_get_many_board_history(session):
+    securities = ["LSNGP", "LSRG", "MOEX"]
+    data = batch.get_many_board_history(session, securities, end="2018-11-19")
+    assert list(data) == securities
+    for security in securities:
+        assert data[security] == moex_requests.get_board_history(session, security, end="2018-11-19")
+
+
+def test_get_many_market_candles(session):
+    data = batch.get_many_market_candles(session, ("RTKM", "LSRG"), max_workers=2, interval=24, end="2020-08-28")
+    assert set(data) == {"RTKM", "LSRG"}
+    assert data["LSRG"][-1]["begin"] == "2020-08-28 00:00:00"
@@ -0,0 +1,153 @@
+"""Тесты для дискового кэша."""
+import asyncio
+import datetime
+import os
+import time
+
+import pytest
+
+from apimoex import aio, cache, client, requests
+
+
+@pytest.fixture(name="file_cache")
+def make_file_cache(tmp_path):
+    return cache.FileCache(tmp_path)
+
+
+@pytest.fixture(name="enabled_cache")
+def enable_cache(tmp_path):
+    cache.configure_cache(path=tmp_path)
+    yield cache.get_cache()
+    cache.configure_cache(enabled=False)
+
+
+def test_make_key():
+    key1 = cache.FileCache.make_key("url", {"a": 1, "b": "2"})
+    key2 = cache.FileCache.make_key("url", {"b": "2", "a": 1})
+    assert key1 == key2
+    assert key1 != cache.FileCache.make_key("url", {"a": 2, "b": "2"})
+    assert key1 != cache.FileCache.make_key("url2", {"a": 1, "b": "2"})
+
+
+def test_ttl(file_cache):
+    assert file_cache.ttl({"till": "2018-01-01"}) == cache.FOREVER
+    assert file_cache.ttl({"date": "2018-01-01"}) == cache.FOREVER
+    assert file_cache.ttl({"till": "2999-01-01"}) == cache.DEFAULT_TTL
+    assert file_cache.ttl({}) == cache.DEFAULT_TTL
+
+
+def test_save_load(file_cache):
+    table = [{"TRADEDATE": "2018-01-03", "CLOSE": 1.5}, {"TRADEDATE": "2018-01-04", "CLOSE": 2.5}]
+    assert file_cache.load("url", {}) is None
+    file_cache.save("url", {}, table)
+    assert file_cache.load("url", {}) == table
+
+
+def test_load_expired(tmp_path):
+    file_cache = cache.FileCache(tmp_path, default_ttl=60)
+    file_cache.save("url", {}, [{"a": 1}])
+    path = tmp_path / f"{file_cache.make_key('url', {})}.parquet"
+    old = time.time() - 120
+    os.utime(path, (old, old))
+    assert file_cache.load("url", {}) is None
+
+
+def test_ttl_saved_at(file_cache):
+    saved_at = datetime.datetime(2024, 1, 3, 12, tzinfo=cache.MOEX_TZ).timestamp()
+    assert file_cache.ttl({"till": "2024-01-03"}, saved_at) == cache.DEFAULT_TTL
+    assert file_cache.ttl({"till": "2024-01-02"}, saved_at) == cache.FOREVER
+
+
+def test_load_saved_same_day(file_cache):
+    query = {"till": "2024-01-03"}
+    file_cache.save("url", query, [{"a": 1}])
+    # noinspection PyProtectedMember
+    path = file_cache._path / f"{file_cache.make_key('url', query)}.parquet"
+    saved_at = datetime.datetime(2024, 1, 3, 12, tzinfo=cache.MOEX_TZ).timestamp()
+    os.utime(path, (saved_at, saved_at))
+    # Данные сохранены до окончания торгового дня и могут быть неполными
+    assert file_cache.load("url", query) is None
+
+
+def test_save_mixed_types(file_cache):
+    file_cache.save("url", {}, [{"a": 1}, {"a": "b"}])
+    assert file_cache.load("url", {}) is None
+
+
+def test_configure_cache(tmp_path):
+    assert cache.get_cache() is None
+    cache.configure_cache(path=tmp_path, default_ttl=10)
+    assert isinstance(cache.get_cache(), cache.FileCache)
+    cache.configure_cache(enabled=False)
+    assert cache.get_cache() is None
+
+
+def test_cached_request(enabled_cache):
+    url = "https://iss.moex.com/iss/history/engines/stock/markets/shares/boards/TQBR/dates.json"
+    table = [{"from": "1997-03-24", "till": "2018-01-03"}]
+    enabled_cache.save(url, {}, table)
+    # При наличии данных в кэше запрос к серверу не осуществляется
+    assert requests.get_board_dates(None) == table
+
+
+def test_cached_async_request(enabled_cache):
+    url = "https://iss.moex.com/iss/history/engines/stock/markets/shares/boards/TQBR/dates.json"
+    table = [{"from": "1997-03-24", "till": "2018-01-03"}]
+    enabled_cache.save(url, {}, table)
+    assert asyncio.run(aio.get_board_dates(None)) == table
+
+
+HISTORY = [
+    {"TRADEDATE": "2018-01-03", "CLOSE": 1.5},
+    {"TRADEDATE": "2018-01-04", "CLOSE": 2.5},
+    {"TRADEDATE": "2018-01-05", "CLOSE": 3.5},
+]
+
+
+def test_lookup_range_suffix(file_cache):
+    file_cache.store("url", {"from": "2018-01-01", "till": "2018-01-05", "a": 1}, HISTORY, "TRADEDATE")
+    rows, missing_query = file_cache.lookup("url", {"from": "2018-01-04", "till": "2018-01-10", "a": 1}, "TRADEDATE")
+    assert rows == HISTORY[1:]
+    assert missing_query == {"from": "2018-01-06", "till": "2018-01-10", "a": 1}
+
+
+def test_lookup_range_inside(file_cache):
+    file_cache.store("url", {"till": "2018-01-05"}, HISTORY, "TRADEDATE")
+    rows, missing_query = file_cache.lookup("url", {"from": "2018-01-02", "till": "2018-01-04"}, "TRADEDATE")
+    assert rows == HISTORY[:2]
+    assert missing_query is None
+
+
+def test_lookup_range_other_query(file_cache):
+    file_cache.store("url", {"till": "2018-01-05", "a": 1}, HISTORY, "TRADEDATE")
+    rows, missing_query = file_cache.lookup("url", {"till": "2018-01-10", "a": 2}, "TRADEDATE")
+    assert rows == []
+    assert missing_query == {"till": "2018-01-10", "a": 2}
+
+
+def test_lookup_range_weekly_candles(file_cache):
+    candles = [{"begin": "2023-12-25 00:00:00", "close": 1.5}, {"begin": "2024-01-01 00:00:00", "close": 2.5}]
+    file_cache.store("url", {"interval": 7, "till": "2024-01-03"}, candles, "begin")
+    query = {"interval": 7, "till": "2024-01-31"}
+    # Свеча за неделю с 2024-01-01 в сохраненных данных неполная, поэтому данные загружаются заново
+    rows, missing_query = file_cache.lookup("url", query, "begin")
+    assert rows == []
+    assert missing_query == query
+    # noinspection PyProtectedMember
+    assert file_cache._read_manifest() == []
+
+
+def test_partially_cached_request(enabled_cache, monkeypatch):
+    url = "https://iss.moex.com/iss/history/engines/stock/markets/shares/boards/TQBR/securities/LSRG.json"
+    # noinspection PyProtectedMember
+    query = requests._make_query(end="2018-01-04", table="history", columns=("TRADEDATE", "CLOSE"))
+    enabled_cache.store(url, query, HISTORY[:2], "TRADEDATE")
+
+    def fake_get_all(iss):
+        # noinspection PyProtectedMember
+        assert iss._query["from"] == "2018-01-05"
+        return {"history": HISTORY[2:]}
+
+    monkeypatch.setattr(client.ISSClient, "get_all", fake_get_all)
+    data = requests.get_board_history(None, "LSRG", end="2018-01-10", columns=("TRADEDATE", "CLOSE"))
+    assert data == HISTORY
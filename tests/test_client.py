@@ -62,7 +62,7 @@ def test_get_wrong_json(monkeypatch, session):
     url = "https://iss.moex.com/iss/securities.json"
     iss = client.ISSClient(session, url)
     # noinspection PyProtectedMember
-    monkeypatch.setattr(requests.Response, "json", lambda x: [0, 1, 2])
+    monkeypatch.setattr(client, "_load_json", lambda x: [0, 1, 2])
     with pytest.raises(client.ISSMoexError) as error:
         iss.get()
     assert "Ответ содержит некорректные данные" in str(error.value)
@@ -140,7 +140,7 @@ def test_wrong_cursor_size(monkeypatch, session):
     iss = client.ISSClient(session, "")
     fake_cursor = {"history.cursor": [0, 1]}
 
-    monkeypatch.setattr(iss, "get", lambda x: fake_cursor)
+    monkeypatch.setattr(iss, "_get", lambda query: fake_cursor)
     with pytest.raises(client.ISSMoexError) as error:
         iss.get_all()
     assert f"Некорректные данные history.cursor [0, 1] для начальной позиции 0" in str(error.value)
@@ -150,7 +150,49 @@ def test_wrong_cursor_index(monkeypatch, session):
     iss = client.ISSClient(session, "")
     fake_cursor = {"history.cursor": [{"INDEX": 1}]}
 
-    monkeypatch.setattr(iss, "get", lambda x: fake_cursor)
+    monkeypatch.setattr(iss, "_get", lambda query: fake_cursor)
     with pytest.raises(client.ISSMoexError) as error:
         iss.get_all()
     assert "Некорректные данные history.cursor [{'INDEX': 1}] для начальной позиции 0" in str(error.value)
+
+
+def test_get_candles_without_metadata(session):
+    url = "https://iss.moex.com/iss/engines/stock/markets/shares/securities/SNGSP/candles.json"
+    query = {
+        "interval": 24,
+        "from": "2018-01-01",
+        "till": "2018-01-10",
+        "iss.only": "candles,history.cursor",
+        "candles.columns": "begin,close",
+    }
+    iss = client.ISSClient(session, url, query)
+    raw = iss.get()
+    assert list(raw) == ["candles"]
+    data = raw["candles"]
+    assert len(data) > 1
+    assert data[0]["begin"] == "2018-01-03 00:00:00"
+    for row in data:
+        assert set(row) == {"begin", "close"}
+
+
+def test_ijson_fast_backend_only():
+    # noinspection PyProtectedMember
+    assert client.ijson is None or client.ijson.backend in client._FAST_IJSON_BACKENDS
+
+
+def test_iter_reuses_query(monkeypatch, session):
+    iss = client.ISSClient(session, "test_url", dict(test_param="test_value"))
+    pages = [{"data": [{"a": 1}] * 100}, {"data": [{"a": 2}] * 100}, {"data": []}]
+    queries = []
+
+    def fake_get(query):
+        queries.append((query, dict(query)))
+        return pages[len(queries) - 1]
+
+    monkeypatch.setattr(iss, "_get", fake_get)
+    assert len(iss.get_all()["data"]) == 200
+    assert [snapshot.get("start") for _, snapshot in queries] == [None, 100, 200]
+    # Один словарь на все блоки данных, не совпадающий с общим набором параметров клиента
+    assert all(query is queries[0][0] for query, _ in queries)
+    # noinspection PyProtectedMember
+    assert "start" not in iss._page_query
@@ -0,0 +1,54 @@
+"""Тесты для загрузки метрик AlgoPack в виде DataFrame."""
+import numpy as np
+import pytest
+
+# noinspection PyProtectedMember
+from apimoex import frames
+
+
+@pytest.mark.parametrize(
+    ("column", "inferred_kind", "dtype"),
+    [
+        ("tradedate", "O", "datetime64[ns]"),
+        ("vol_b", "i", None),
+        ("vol_b", "f", "float64"),
+        ("put_orders_s", "O", "float64"),
+        ("cancel_vol", "i", None),
+        ("pr_vwap", "i", "float64"),
+        ("sec_pr_close", "f", "float64"),
+        ("val_s", "f", "float64"),
+        ("secid", "O", None),
+        ("SYSTIME", "O", None),
+    ],
+)
+def test_dtype(column, inferred_kind, dtype):
+    assert frames._dtype(column, inferred_kind) == dtype
+
+
+def test_to_frame():
+    table = [
+        {"tradedate": "2024-08-13", "secid": "SBER", "pr_open": 281.05, "vol": 10, "trades_b": None},
+        {"tradedate": "2024-08-14", "secid": "SBER", "pr_open": 282, "vol": 20, "trades_b": 3},
+    ]
+    df = frames._to_frame(table, ("tradedate", "secid"))
+    assert list(df.columns) == ["tradedate", "secid", "pr_open", "vol", "trades_b"]
+    assert df["tradedate"].dtype.kind == "M"
+    assert df["pr_open"].dtype == np.float64
+    assert df["vol"].dtype == np.int64
+    assert df["trades_b"].dtype == np.float64
+    assert np.isnan(df.at[0, "trades_b"])
+    assert df.at[1, "pr_open"] == pytest.approx(282)
+    assert df.at[0, "secid"] == "SBER"
+
+
+def test_to_frame_fractional_counts():
+    df = frames._to_frame([{"vol_b": 10.7, "sec_pr_close": 300}, {"vol_b": 3, "sec_pr_close": 301}], None)
+    assert df["vol_b"].dtype == np.float64
+    assert df.at[0, "vol_b"] == pytest.approx(10.7)
+    assert df["sec_pr_close"].dtype == np.float64
+
+
+def test_to_frame_empty():
+    df = frames._to_frame([], ("tradedate", "secid"))
+    assert df.empty
+    assert list(df.columns) == ["tradedate", "secid"]
@@ -0,0 +1,58 @@
+"""Тесты для запросов по протоколу HTTP/2."""
+import asyncio
+
+import pytest
+
+from apimoex import aio, batch, client, http2
+from apimoex import requests as moex_requests
+
+
+@pytest.fixture(scope="module", name="session")
+def make_session():
+    with http2.make_http2_session() as session:
+        yield session
+
+
+def test_transport(session):
+    assert isinstance(session, client.Transport)
+    assert not isinstance(session, client.AsyncTransport)
+
+
+def test_async_transport():
+    async def main():
+        async with http2.make_async_http2_session() as session:
+            return isinstance(session, client.AsyncTransport), isinstance(session, client.Transport)
+
+    assert asyncio.run(main()) == (True, False)
+
+
+def test_get_wrong_url(session):
+    iss = client.ISSClient(session, "https://iss.moex.com/iss/securities1.json")
+    with pytest.raises(client.ISSMoexError) as error:
+        iss.get()
+    assert "Неверный url" in str(error.value)
+    assert "https://iss.moex.com/iss/securities1.json?iss.json=extended&iss.meta=off" in str(error.value)
+
+
+def test_get_board_history(session):
+    data = moex_requests.get_board_history(session, "LSNGP", end="2014-08-01")
+    assert data[0]["TRADEDATE"] == "2014-06-09"
+    assert data[0]["CLOSE"] == pytest.approx(14.7)
+
+
+def test_get_many_board_history(session):
+    data = batch.get_many_board_history(session, ["LSNGP", "LSRG"], end="2014-08-01")
+    assert data["LSNGP"][0]["TRADEDATE"] == "2014-06-09"
+
+
+def test_async_get_board_history():
+    async def main():
+        async with http2.make_async_http2_session() as session:
+            return await asyncio.gather(
+                aio.get_board_history(session, "LSNGP", end="2014-08-01"),
+                aio.get_market_candles(session, "RTKM", interval=1, end="2011-12-16"),
+            )
+
+    history, candles = asyncio.run(main())
+    assert history[0]["TRADEDATE"] == "2014-06-09"
+    assert candles[0]["open"] == pytest.approx(141.55)
@@ -0,0 +1,61 @@
+"""Тесты для ограничения частоты запросов."""
+import asyncio
+import types
+
+import pytest
+
+from apimoex import ratelimit, requests
+
+
+@pytest.fixture(name="restore_rate_limit")
+def restore_default_rate_limit():
+    yield
+    ratelimit.configure_rate_limit()
+
+
+def test_wrong_params():
+    with pytest.raises(ValueError, match="Некорректные параметры"):
+        ratelimit.TokenBucket(rate=0)
+    with pytest.raises(ValueError, match="Некорректные параметры"):
+        ratelimit.TokenBucket(burst=0)
+
+
+def test_reserve():
+    bucket = ratelimit.TokenBucket(rate=10, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_acquire():
+    bucket = ratelimit.TokenBucket(rate=100, burst=1)
+    bucket.acquire()
+    bucket.acquire()
+    asyncio.run(bucket.acquire_async())
+    assert bucket.reserve() == pytest.approx(0.01, abs=0.01)
+
+
+@pytest.mark.usefixtures("restore_rate_limit")
+def test_get_bucket():
+    bucket = ratelimit.get_bucket("https://iss.moex.com/iss/securities.json")
+    assert isinstance(bucket, ratelimit.TokenBucket)
+    assert bucket is ratelimit.get_bucket("https://iss.moex.com/iss/history.json")
+    assert bucket is not ratelimit.get_bucket("https://passport.moex.com/authenticate")
+
+    ratelimit.configure_rate_limit(enabled=False)
+    assert ratelimit.get_bucket("https://iss.moex.com/iss/securities.json") is None
+
+    ratelimit.configure_rate_limit(rate=2, burst=1)
+    assert repr(ratelimit.get_bucket("https://iss.moex.com")) == "TokenBucket(rate=2, burst=1)"
+
+
+@pytest.mark.usefixtures("restore_rate_limit")
+def test_authenticate_uses_passport_bucket():
+    class FakeSession:
+        def get(self, url, headers):
+            return types.SimpleNamespace(status_code=200)
+
+    ratelimit.configure_rate_limit(rate=1, burst=1)
+    assert requests.authenticate(FakeSession(), "user", "pass")
+    assert ratelimit.get_bucket("https://passport.moex.com").reserve() > 0
+    assert ratelimit.get_bucket("https://iss.moex.com").reserve() == 0
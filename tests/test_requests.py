@@ -27,19 +27,27 @@ def test_make_query_full():
         interval=60,
         start="2019-10-09",
         end="2019-11-12",
+        tradeno="11287155409",
         table="new_table",
         columns=("4", "a"),
     )
     assert isinstance(query, dict)
-    assert len(query) == 6
+    assert len(query) == 7
     assert query["q"] == "GAZP"
     assert query["interval"] == 60
     assert query["from"] == "2019-10-09"
     assert query["till"] == "2019-11-12"
+    assert query["tradeno"] == "11287155409"
     assert query["iss.only"] == "new_table,history.cursor"
     assert query["new_table.columns"] == "4,a"
 
 
+def test_basic_auth_header():
+    # noinspection PyProtectedMember
+    header = requests._basic_auth_header("user", "pass")
+    assert header == {"Authorization": "Basic dXNlcjpwYXNz"}
+
+
 def test_get_table():
     # noinspection PyProtectedMember
     query = requests._get_table(dict(a="b"), "a")
@@ -329,4 +337,14 @@ def test_get_orderstats(session):
     assert df.index[-1] >= "2024-08-14"
     assert df.at["2024-08-13 10:05:14", "put_orders_b"] == 47400
     assert df.at["2024-08-13 10:05:14", "cancel_orders"] == 67706
-        
\ No newline at end of file
+        
+
+def test_make_query_default_columns():
+    # noinspection PyProtectedMember
+    query = requests._make_query(table="candles", columns=requests._CANDLE_COLS)
+    assert query["candles.columns"] == "begin,open,close,high,low,value,volume"
+    # noinspection PyProtectedMember
+    query = requests._make_query(table="history", columns=requests._HISTORY_COLS)
+    assert query["history.columns"] == "BOARDID,TRADEDATE,CLOSE,VOLUME,VALUE"
+    query = requests._make_query(table="history", columns=("BOARDID", "TRADEDATE", "CLOSE", "VOLUME", "VALUE"))
+    assert query["history.columns"] == "BOARDID,TRADEDATE,CLOSE,VOLUME,VALUE"
@@ -0,0 +1,26 @@
+"""Тесты для создания http сессии."""
+import requests
+from urllib3.util import make_headers
+
+from apimoex import session as moex_session
+
+
+def test_make_session():
+    with moex_session.make_session() as session:
+        assert isinstance(session, requests.Session)
+        adapter = session.get_adapter("https://iss.moex.com")
+        # noinspection PyProtectedMember
+        assert adapter._pool_connections == moex_session.POOL_CONNECTIONS
+        # noinspection PyProtectedMember
+        assert adapter._pool_maxsize == moex_session.POOL_MAXSIZE
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert 429 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.respect_retry_after_header
+
+
+def test_make_session_accept_encoding():
+    with moex_session.make_session() as session:
+        accept_encoding = session.headers["Accept-Encoding"]
+        assert accept_encoding == make_headers(accept_encoding=True)["accept-encoding"]
+        assert "gzip" in accept_encoding